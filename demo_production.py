@@ -85,11 +85,16 @@ class ProductionDemo:
         with open(path) as f:
             return yaml.safe_load(f)
     
-    def _create_execution_context(self, user_intent: str) -> ExecutionContext:
-        """Create execution context with trace_id."""
+    def _create_execution_context(
+        self,
+        user_intent: str,
+        trace_id: Optional[str] = None,
+    ) -> ExecutionContext:
+        """Create execution context with trace_id (defaults to the emitter's)."""
+        trace_id = trace_id or self.trace_emitter.trace_id
         return ExecutionContext(
-            trace_id=self.trace_emitter.trace_id,
-            request_id=f"req-{self.trace_emitter.trace_id}",
+            trace_id=trace_id,
+            request_id=f"req-{trace_id}",
             user_intent=user_intent,
             profile=self.profile_name,
             memory_scope="production-demo/session-1",
@@ -474,8 +479,24 @@ class ProductionDemo:
         print("  ✓ Graceful degradation on step failures")
         print("=" * 80 + "\n")
     
-    async def run_demo(self, goal: str, prospect_data: Dict[str, Any]) -> None:
-        """Run complete production demo."""
+    async def run_demo(
+        self,
+        goal: str,
+        prospect_data: Dict[str, Any],
+        trace_id: Optional[str] = None,
+    ) -> None:
+        """
+        Run complete production demo.
+        
+        Args:
+            goal: High-level user objective
+            prospect_data: Prospect information
+            trace_id: Optional per-run trace_id, so one demo instance can serve
+                concurrent runs with separate traces (defaults to the emitter's)
+        """
+        # 1. Create execution context
+        context = self._create_execution_context(goal, trace_id)
+        
         print("\n🚀 CUGAr-SALES Production Demo Starting...")
         print(f"Goal: {goal}")
         print(f"Profile: {self.profile_name}")
@@ -486,10 +507,7 @@ class ProductionDemo:
         else:
             print("🤖 LLM: Offline mode (rule-based)")
         
-        print(f"Trace ID: {self.trace_emitter.trace_id}\n")
-        
-        # 1. Create execution context
-        context = self._create_execution_context(goal)
+        print(f"Trace ID: {context.trace_id}\n")
         
         # 2. Create multi-domain plan (async)
         plan = await self.create_multi_domain_plan(goal, context, prospect_data)
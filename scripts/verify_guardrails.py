@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Sequence
@@ -11,6 +13,46 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 ROOT_AGENTS = REPO_ROOT / "AGENTS.md"
 CHANGELOG = REPO_ROOT / "CHANGELOG.md"
 INHERIT_MARKER = "Root guardrails apply as-is; no directory-specific overrides."
+_INHERIT_MARKER_BYTES = INHERIT_MARKER.encode("utf-8")
+# Never descended into when looking for local AGENTS.md files
+SKIPPED_WALK_DIRS = frozenset({".git"})
+# Allowlisted-dir marker checks fan out to threads from this many dirs up
+PARALLEL_MARKER_MIN_DIRS = 4
+MAX_MARKER_WORKERS = 32
+
+
+class GuardrailError(str):
+    """Human-readable guardrail error carrying a stable ``code`` for classification.
+
+    Subclasses ``str`` so existing callers (printing, substring checks,
+    comparisons) keep working; tooling can branch on ``code`` instead of
+    matching message text.
+    """
+
+    code: str
+
+    def __new__(cls, code: str, message: str) -> "GuardrailError":
+        error = super().__new__(cls, message)
+        error.code = code
+        return error
+
+    def __reduce__(self) -> tuple[type["GuardrailError"], tuple[str, str]]:
+        # Rebuild through the two-argument constructor (pickle, copy)
+        return (type(self), (self.code, str(self)))
+
+
+MISSING_AGENTS = "MISSING_AGENTS"
+MISSING_ROOT_KEYWORDS = "MISSING_ROOT_KEYWORDS"
+MISSING_INTERFACE_CONTRACTS = "MISSING_INTERFACE_CONTRACTS"
+MISSING_INHERIT_MARKER = "MISSING_INHERIT_MARKER"
+INVALID_INHERIT_MARKER = "INVALID_INHERIT_MARKER"
+LOCAL_AGENTS_CANONICAL = "LOCAL_AGENTS_CANONICAL"
+LOCAL_AGENTS_MISSING_MARKER = "LOCAL_AGENTS_MISSING_MARKER"
+MISSING_CHANGELOG = "MISSING_CHANGELOG"
+MISSING_VNEXT = "MISSING_VNEXT"
+EMPTY_VNEXT = "EMPTY_VNEXT"
+MISSING_VNEXT_GUARDRAIL = "MISSING_VNEXT_GUARDRAIL"
+MISSING_DOC_UPDATE = "MISSING_DOC_UPDATE"
 
 
 @dataclass(frozen=True)
@@ -119,54 +161,94 @@ def _load_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def ensure_root_guardrails(content: str) -> list[str]:
-    errors: list[str] = []
+def ensure_root_guardrails(content: str) -> list[GuardrailError]:
+    errors: list[GuardrailError] = []
     lowered = content.lower()
     missing_keywords = [kw for kw in CONFIG.guardrail_keywords if kw.lower() not in lowered]
     if missing_keywords:
         errors.append(
-            f"Root guardrails must mention keywords for allowlists/denylist/budgets/escalations/redaction: {', '.join(missing_keywords)}"
+            GuardrailError(
+                MISSING_ROOT_KEYWORDS,
+                f"Root guardrails must mention keywords for allowlists/denylist/budgets/escalations/redaction: {', '.join(missing_keywords)}",
+            )
         )
 
     missing_interfaces = [kw for kw in CONFIG.interface_keywords if kw.lower() not in lowered]
     if missing_interfaces:
         errors.append(
-            "Root guardrails must document planner/worker/coordinator contracts and trace expectations."
+            GuardrailError(
+                MISSING_INTERFACE_CONTRACTS,
+                "Root guardrails must document planner/worker/coordinator contracts and trace expectations.",
+            )
         )
 
     return errors
 
 
-def ensure_allowlisted_inherit_markers(repo_root: Path) -> list[str]:
-    errors: list[str] = []
-    for dirname in CONFIG.allowlisted_dirs:
-        target_dir = repo_root / dirname
-        if not target_dir.exists():
-            continue
-        marker = target_dir / CONFIG.inherit_filename
-        if not marker.exists():
-            errors.append(f"Missing guardrail inheritance marker in {dirname}")
-            continue
-        content = marker.read_text(encoding="utf-8").strip()
-        if INHERIT_MARKER not in content:
-            errors.append(
-                f"Guardrail inheritance marker in {dirname} must state that root guardrails apply unchanged."
-            )
-    return errors
+def _has_inherit_marker(marker: Path) -> bool:
+    # Markers normally open with the sentence, so compare just that many bytes
+    # first; only fall back to decoding the whole file when the prefix differs.
+    with marker.open("rb") as handle:
+        if handle.read(len(_INHERIT_MARKER_BYTES)) == _INHERIT_MARKER_BYTES:
+            return True
+    return INHERIT_MARKER in marker.read_text(encoding="utf-8")
+
+
+def _check_inherit_marker(repo_root: Path, dirname: str) -> GuardrailError | None:
+    target_dir = repo_root / dirname
+    if not target_dir.exists():
+        return None
+    marker = target_dir / CONFIG.inherit_filename
+    if not marker.exists():
+        return GuardrailError(MISSING_INHERIT_MARKER, f"Missing guardrail inheritance marker in {dirname}")
+    if not _has_inherit_marker(marker):
+        return GuardrailError(
+            INVALID_INHERIT_MARKER,
+            f"Guardrail inheritance marker in {dirname} must state that root guardrails apply unchanged.",
+        )
+    return None
+
+
+def ensure_allowlisted_inherit_markers(repo_root: Path) -> list[GuardrailError]:
+    dirs = CONFIG.allowlisted_dirs
+    check = functools.partial(_check_inherit_marker, repo_root)
+    if len(dirs) < PARALLEL_MARKER_MIN_DIRS:
+        results = [check(dirname) for dirname in dirs]
+    else:
+        # Marker checks are tiny IO-bound reads; overlap them, keeping config order
+        with ThreadPoolExecutor(max_workers=min(MAX_MARKER_WORKERS, len(dirs))) as pool:
+            results = list(pool.map(check, dirs))
+    return [error for error in results if error is not None]
 
 
-def ensure_local_agents_inherit(repo_root: Path) -> list[str]:
-    errors: list[str] = []
-    for agents_file in repo_root.rglob("AGENTS.md"):
+def _find_agents_files(repo_root: Path) -> Iterable[Path]:
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        # Prune in place so os.walk skips VCS internals entirely
+        dirnames[:] = [name for name in dirnames if name not in SKIPPED_WALK_DIRS]
+        if "AGENTS.md" in filenames:
+            yield Path(dirpath) / "AGENTS.md"
+
+
+def ensure_local_agents_inherit(repo_root: Path) -> list[GuardrailError]:
+    errors: list[GuardrailError] = []
+    for agents_file in _find_agents_files(repo_root):
         if agents_file.resolve() == ROOT_AGENTS.resolve():
             continue
         content = agents_file.read_text(encoding="utf-8")
         if "canonical" in content.lower():
             errors.append(
-                f"{agents_file} must not claim canonical status; root AGENTS.md is the single source of truth."
+                GuardrailError(
+                    LOCAL_AGENTS_CANONICAL,
+                    f"{agents_file} must not claim canonical status; root AGENTS.md is the single source of truth.",
+                )
             )
         if INHERIT_MARKER not in content:
-            errors.append(f"{agents_file} must include the inheritance marker to defer to root guardrails.")
+            errors.append(
+                GuardrailError(
+                    LOCAL_AGENTS_MISSING_MARKER,
+                    f"{agents_file} must include the inheritance marker to defer to root guardrails.",
+                )
+            )
     return errors
 
 
@@ -186,13 +268,15 @@ def _extract_vnext_entries(changelog: str) -> list[str]:
     return [line for line in entries if line]
 
 
-def ensure_changelog_structure(changelog_text: str) -> list[str]:
-    errors: list[str] = []
+def ensure_changelog_structure(changelog_text: str) -> list[GuardrailError]:
+    errors: list[GuardrailError] = []
     entries = _extract_vnext_entries(changelog_text)
     if "## vNext" not in changelog_text:
-        errors.append("CHANGELOG.md must contain a '## vNext' section.")
+        errors.append(GuardrailError(MISSING_VNEXT, "CHANGELOG.md must contain a '## vNext' section."))
     elif not entries:
-        errors.append("CHANGELOG.md must list at least one upcoming change under '## vNext'.")
+        errors.append(
+            GuardrailError(EMPTY_VNEXT, "CHANGELOG.md must list at least one upcoming change under '## vNext'.")
+        )
     return errors
 
 
@@ -209,8 +293,8 @@ def _is_guardrail_change(path: str) -> bool:
     return any(posix.startswith(prefix) for prefix in CONFIG.guarded_prefixes)
 
 
-def check_guardrail_change_requirements(changed_files: Iterable[str], changelog_text: str) -> list[str]:
-    errors: list[str] = []
+def check_guardrail_change_requirements(changed_files: Iterable[str], changelog_text: str) -> list[GuardrailError]:
+    errors: list[GuardrailError] = []
     changed = {Path(path).as_posix() for path in changed_files}
     guardrail_changed = any(_is_guardrail_change(path) for path in changed)
     if not guardrail_changed:
@@ -218,25 +302,33 @@ def check_guardrail_change_requirements(changed_files: Iterable[str], changelog_
 
     if not changelog_mentions_guardrails(changelog_text):
         errors.append(
-            "Guardrail or registry changes require a '## vNext' entry mentioning guardrails/registry/sandbox updates."
+            GuardrailError(
+                MISSING_VNEXT_GUARDRAIL,
+                "Guardrail or registry changes require a '## vNext' entry mentioning guardrails/registry/sandbox updates.",
+            )
         )
 
     missing_docs = [doc for doc in CONFIG.required_docs if doc not in changed]
     if missing_docs:
         errors.append(
-            "Guardrail changes must update documentation and runbooks; missing updates for: "
-            + ", ".join(missing_docs)
+            GuardrailError(
+                MISSING_DOC_UPDATE,
+                "Guardrail changes must update documentation and runbooks; missing updates for: "
+                + ", ".join(missing_docs),
+            )
         )
 
     return errors
 
 
-def run_checks(changed_files: Iterable[str] | None = None, base: str | None = None) -> List[str]:
-    errors: list[str] = []
+def run_checks(changed_files: Iterable[str] | None = None, base: str | None = None) -> List[GuardrailError]:
+    errors: list[GuardrailError] = []
     files = list(changed_files) if changed_files is not None else collect_changed_files(base)
 
     if not ROOT_AGENTS.exists():
-        errors.append("Root AGENTS.md is missing; guardrails must be defined at the repo root.")
+        errors.append(
+            GuardrailError(MISSING_AGENTS, "Root AGENTS.md is missing; guardrails must be defined at the repo root.")
+        )
         return errors
 
     root_content = _load_text(ROOT_AGENTS)
@@ -246,7 +338,11 @@ def run_checks(changed_files: Iterable[str] | None = None, base: str | None = No
     errors.extend(ensure_local_agents_inherit(REPO_ROOT))
 
     if not CHANGELOG.exists():
-        errors.append("CHANGELOG.md is missing; document guardrail and registry changes under '## vNext'.")
+        errors.append(
+            GuardrailError(
+                MISSING_CHANGELOG, "CHANGELOG.md is missing; document guardrail and registry changes under '## vNext'."
+            )
+        )
     else:
         changelog_text = _load_text(CHANGELOG)
         errors.extend(ensure_changelog_structure(changelog_text))
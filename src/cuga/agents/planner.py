@@ -57,7 +57,7 @@ class Planner:
         prefs = preferences or PlanningPreferences()
         trace: List[str] = []
 
-        profiles = sorted(list(registry.profiles()))
+        profiles = registry.sorted_profiles()
         if not profiles:
             raise ValueError("No profiles available for planning")
         profile = profiles[0]
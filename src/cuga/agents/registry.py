@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import copy
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Mapping, TypedDict
+from typing import Any, Callable, Dict, List, Mapping, TypedDict
 
 ToolCallable = Callable[..., Any]
 
@@ -24,6 +24,8 @@ class ToolRegistry:
     """Manages tool exposure per profile without cross-talk."""
 
     _tools: Dict[str, Dict[str, ToolEntry]] = field(default_factory=dict)
+    # Sorted profile names, rebuilt lazily after each registration
+    _sorted_profiles: List[str] | None = field(default=None, init=False, repr=False, compare=False)
 
     def register(
         self,
@@ -39,6 +41,7 @@ class ToolRegistry:
         profile_tools = self._tools.setdefault(profile, {})
         if name in profile_tools:
             raise ValueError(f"Tool '{name}' already registered for profile '{profile}'")
+        self._sorted_profiles = None
         profile_tools[name] = {
             "handler": handler,
             "config": copy.deepcopy(dict(config or {})),
@@ -76,3 +79,10 @@ class ToolRegistry:
 
     def profiles(self) -> set[str]:
         return set(self._tools.keys())
+
+    def sorted_profiles(self) -> List[str]:
+        """Profile names in sorted order, cached until the next registration."""
+
+        if self._sorted_profiles is None:
+            self._sorted_profiles = sorted(self._tools)
+        return list(self._sorted_profiles)
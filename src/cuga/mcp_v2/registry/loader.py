@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import copy
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
@@ -24,6 +26,7 @@ from .snapshot import RegistrySnapshot
 ENV_REGISTRY_PATH = "CUGA_MCP_REGISTRY_PATH"
 _BOOL_TRUE = {"1", "true", "yes", "on"}
 _ENV_PATTERN = re.compile(r"\$\{oc\.env:([^,}]+)(?:,\s*\"([^}]*)\")?}")
+_MAX_FRAGMENT_WORKERS = 8
 
 
 def _coerce_bool(value: Any, *, default: bool = True) -> bool:
@@ -70,7 +73,7 @@ def _parse_tool(name: str, raw: Mapping[str, Any], env: Mapping[str, str]) -> MC
         operation_id=operation_id,
         method=method.upper() if isinstance(method, str) else method,
         path=_resolve_env_placeholders(path, env),
-        schema=raw.get("schema"),
+        schema=copy.deepcopy(raw.get("schema")),
         enabled=enabled,
         enabled_env=raw.get("enabled_env"),
     )
@@ -99,7 +102,7 @@ def _parse_server(name: str, raw: Mapping[str, Any], env: Mapping[str, str]) ->
     return MCPServerDefinition(
         name=name,
         url=url,
-        schema=raw.get("schema"),
+        schema=copy.deepcopy(raw.get("schema")),
         enabled=enabled,
         enabled_env=raw.get("enabled_env"),
         tools=tuple(tool for tool in parsed_tools if tool.enabled),
@@ -147,6 +150,30 @@ def _resolve_env_placeholders(value: Any, env: Mapping[str, str]) -> Any:
     return value
 
 
+def _load_document(path: Path) -> Any:
+    """Parse a registry document, reusing the previous parse while the file is unchanged.
+
+    Cached documents are shared between calls; ``_parse_tool``/``_parse_server``
+    copy the mutable values they hand out so snapshots never alias the cache.
+    """
+
+    from cuga.registry.loader import _read_registry_file, _stat_cached_load
+
+    return _stat_cached_load(path, _read_registry_file)
+
+
+def _load_fragments(paths: Sequence[Path]) -> list[Any]:
+    """Read and parse fragment files, overlapping file I/O across a thread pool.
+
+    Results keep the order of ``paths`` so merging stays deterministic.
+    """
+
+    if len(paths) < 2:
+        return [_load_document(fragment_path) for fragment_path in paths]
+    with ThreadPoolExecutor(max_workers=min(_MAX_FRAGMENT_WORKERS, len(paths))) as pool:
+        return list(pool.map(_load_document, paths))
+
+
 def load_mcp_registry_snapshot(
     path: str | Path | None = None,
     *,
@@ -165,16 +192,16 @@ def load_mcp_registry_snapshot(
     if load_registry_config is not None and DictConfig is not None and OmegaConf is not None:
         documents = load_registry_config(resolved_path)
     else:
-        from cuga.registry.loader import _safe_load
-
-        base = _safe_load(resolved_path.read_text())
-        documents = [(resolved_path, base)]
+        base = _load_document(resolved_path)
         defaults = base.get("defaults", []) if isinstance(base, Mapping) else []
+        fragment_paths: list[Path] = []
         for entry in defaults:
             if isinstance(entry, str) and entry != "_self_":
                 fragment_path = (resolved_path.parent / f"{entry}.yaml").resolve()
                 if fragment_path.exists():
-                    documents.append((fragment_path, _safe_load(fragment_path.read_text())))
+                    fragment_paths.append(fragment_path)
+        documents = [(resolved_path, base)]
+        documents.extend(zip(fragment_paths, _load_fragments(fragment_paths)))
     servers = _merge_servers(documents, env)
     sources = tuple(path for path, _ in documents)
     return RegistrySnapshot(servers=servers, sources=sources)
@@ -21,6 +21,9 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# {{variable_name}} placeholders, compiled once for the drafting hot path
+_TEMPLATE_VARIABLE_RE = re.compile(r'\{\{(\w+)\}\}')
+
 
 class MessageChannel(str, Enum):
     """Communication channels for outreach."""
@@ -118,19 +121,23 @@ def draft_outbound_message(inputs: Dict[str, Any], context: Dict[str, Any]) -> D
         }
     
     # Extract variables from template ({{variable_name}} pattern)
-    template_variables = set(re.findall(r'\{\{(\w+)\}\}', template))
+    template_variables = set(_TEMPLATE_VARIABLE_RE.findall(template))
     
     # Identify missing variables
     provided_variables = set(prospect_data.keys())
     missing_variables = list(template_variables - provided_variables)
     variables_used = list(template_variables & provided_variables)
     
-    # Render template with available data
-    message_draft = template
-    for var_name in variables_used:
-        placeholder = f"{{{{{var_name}}}}}"
-        value = str(prospect_data[var_name])
-        message_draft = message_draft.replace(placeholder, value)
+    # Render template with available data in a single pass; missing
+    # variables are left in place
+    message_draft = _TEMPLATE_VARIABLE_RE.sub(
+        lambda match: (
+            str(prospect_data[match.group(1)])
+            if match.group(1) in prospect_data
+            else match.group(0)
+        ),
+        template,
+    )
     
     # Extract subject line (first line for email/linkedin)
     subject = ""
@@ -380,7 +387,7 @@ def assess_message_quality(inputs: Dict[str, Any], context: Dict[str, Any]) -> D
         })
     
     # Check: Broken template variables
-    broken_vars = re.findall(r'\{\{(\w+)\}\}', message)
+    broken_vars = _TEMPLATE_VARIABLE_RE.findall(message)
     if broken_vars:
         issues.append({
             "issue_type": MessageQualityIssue.BROKEN_VARIABLE.value,
@@ -23,8 +23,12 @@ from __future__ import annotations
 import contextvars
 import time
 import warnings
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict
+
+# Spans kept per tracer; the oldest are dropped once full
+DEFAULT_SPAN_CAPACITY = 4096
 
 trace_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("trace_id", default="")
 
@@ -51,9 +55,12 @@ class InMemoryTracer:
     
     DEPRECATED: This class is deprecated as of v1.1.0 and will be removed in v1.3.0.
     Use `cuga.observability.ObservabilityCollector` via `get_collector()` instead.
+    
+    Spans are kept in a bounded ring buffer (``capacity`` most recent), so
+    reload-heavy workloads cannot grow it without limit.
     """
     
-    def __init__(self) -> None:
+    def __init__(self, capacity: int = DEFAULT_SPAN_CAPACITY) -> None:
         warnings.warn(
             "InMemoryTracer is deprecated as of v1.1.0 and will be removed in v1.3.0. "
             "Use cuga.observability.ObservabilityCollector via get_collector() instead. "
@@ -61,7 +68,7 @@ class InMemoryTracer:
             DeprecationWarning,
             stacklevel=2
         )
-        self.spans: List[Span] = []
+        self.spans: Deque[Span] = deque(maxlen=capacity)
 
     def start_span(self, name: str, **attributes: Any) -> Span:
         tid = trace_id_var.get() or attributes.get("trace_id") or ""
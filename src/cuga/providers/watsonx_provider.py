@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import copy
 import importlib
 import json
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Type
+from typing import Any, Dict, Iterable, Optional, TextIO, Type
 
 _pydantic_spec = importlib.util.find_spec("pydantic")
 if _pydantic_spec:
@@ -29,6 +32,31 @@ else:  # pragma: no cover - soft dependency fallback
     class ValidationError(Exception): ...
 
 
+# JSON schema per function model class; model classes are immutable once defined
+_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+
+
+def _model_schema(fn_model: Type[BaseModel]) -> Dict[str, Any]:
+    schema = _SCHEMA_CACHE.get(fn_model)
+    if schema is None:
+        schema = _SCHEMA_CACHE.setdefault(fn_model, fn_model.model_json_schema())
+    # Callers get their own copy so the cached schema cannot be edited
+    return copy.deepcopy(schema)
+
+
+_orjson_spec = importlib.util.find_spec("orjson")
+if _orjson_spec:
+    _orjson = importlib.import_module("orjson")
+
+    def _dumps_line(record: Dict[str, Any]) -> str:
+        return _orjson.dumps(record, option=_orjson.OPT_APPEND_NEWLINE).decode("utf-8")
+
+else:  # pragma: no cover - soft dependency fallback
+
+    def _dumps_line(record: Dict[str, Any]) -> str:
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+
 _watsonx_spec = importlib.util.find_spec("ibm_watsonx_ai")
 if _watsonx_spec:
     _foundation_spec = importlib.util.find_spec("ibm_watsonx_ai.foundation_models")
@@ -45,6 +73,9 @@ else:  # pragma: no cover - defensive import guard
 DEFAULT_MODEL = os.getenv("MODEL_NAME", "granite-4-h-small")
 DEFAULT_CONFIG_PATH = Path(os.getenv("AGENT_SETTING_CONFIG", "settings.watsonx.toml"))
 
+# Seeded generations remembered per provider; repeats skip the model call
+SEEDED_CACHE_SIZE = 1024
+
 
 @dataclass
 class WatsonxProvider:
@@ -83,6 +114,27 @@ class WatsonxProvider:
         self.audit_path = Path(self.audit_path)
         self.audit_path.parent.mkdir(parents=True, exist_ok=True)
         self._validate_environment()
+        self._init_runtime_state()
+
+    def _init_runtime_state(self) -> None:
+        # Per-instance runtime state, deliberately not dataclass fields so
+        # asdict()/replace()/repr only see configuration.
+        self._seeded_responses: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._audit_handle: Optional[TextIO] = None
+        self._audit_handle_path: Optional[Path] = None
+        self._audit_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Open handles and locks cannot be copied or pickled; copies reopen lazily
+        state = dict(self.__dict__)
+        state["_audit_handle"] = None
+        state["_audit_handle_path"] = None
+        state.pop("_audit_lock", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._audit_lock = threading.Lock()
 
     def _validate_environment(self) -> None:
         """Validate required environment variables for Watsonx API access.
@@ -127,14 +179,30 @@ class WatsonxProvider:
         )
 
     def generate(self, prompt: str, *, seed: int | None = None) -> Dict[str, Any]:
+        """Generate text, reusing the response for a repeated seeded request.
+
+        With a seed, the same (model, parameters, prompt, seed) is reproducible,
+        so the model is only invoked once per key; every call is still audited.
+        """
         # Credentials validated in __post_init__
+        parameters = self.parameters
         payload = {
             "prompt": prompt,
             "model_id": self.model_id,
-            "parameters": self.parameters,
+            "parameters": parameters,
             "seed": seed,
         }
 
+        cache_key = None
+        if seed is not None:
+            cache_key = (self.model_id, tuple(sorted(parameters.items())), prompt, seed)
+            cached = self._seeded_responses.get(cache_key)
+            if cached is not None:
+                self._seeded_responses.move_to_end(cache_key)
+                response = copy.deepcopy(cached)
+                payload["token_usage"] = response.get("token_usage")
+                return self._write_audit_and_return(payload, response)
+
         if self.client is None and Model is None:
             token_usage = {"input_tokens": len(prompt)}
             response: Dict[str, Any] = {
@@ -148,6 +216,11 @@ class WatsonxProvider:
             if "token_usage" not in response and "usage" in response:
                 response["token_usage"] = response.get("usage")
 
+        if cache_key is not None:
+            self._seeded_responses[cache_key] = copy.deepcopy(response)
+            if len(self._seeded_responses) > SEEDED_CACHE_SIZE:
+                self._seeded_responses.popitem(last=False)
+
         payload["token_usage"] = response.get("token_usage")
         return self._write_audit_and_return(payload, response)
 
@@ -171,7 +244,7 @@ class WatsonxProvider:
         errors: list[str] = []
         for fn_model in functions:
             try:
-                schema = fn_model.model_json_schema()
+                schema = _model_schema(fn_model)
                 props = schema.get("properties", {})
                 required = schema.get("required", [])
                 if not isinstance(props, dict) or not props:
@@ -210,13 +283,37 @@ class WatsonxProvider:
             "response_meta": {"token_usage": payload.get("token_usage")},
             "outcome": {"status": "success"},
         }
-        self.audit_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.audit_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record) + "\n")
+        line = _dumps_line(record)
+        audit_path = Path(self.audit_path)
+        with self._audit_lock:
+            if self._audit_handle is not None and self._audit_handle_path != audit_path:
+                # audit_path was reassigned since the handle was opened
+                self._audit_handle.close()
+                self._audit_handle = None
+            if self._audit_handle is None:
+                audit_path.parent.mkdir(parents=True, exist_ok=True)
+                # Kept open across calls; line buffering flushes each record
+                self._audit_handle = audit_path.open("a", buffering=1, encoding="utf-8")
+                self._audit_handle_path = audit_path
+            self._audit_handle.write(line)
 
         combined = dict(response)
         combined["audit"] = record
         return combined
 
+    def close(self) -> None:
+        """Close the audit log handle; a later call reopens it."""
+
+        with self._audit_lock:
+            if self._audit_handle is not None:
+                self._audit_handle.close()
+                self._audit_handle = None
+                self._audit_handle_path = None
+
+    def __del__(self) -> None:
+        handle = getattr(self, "_audit_handle", None)
+        if handle is not None:
+            handle.close()
+
 
 __all__ = ["WatsonxProvider", "DEFAULT_MODEL", "DEFAULT_CONFIG_PATH"]
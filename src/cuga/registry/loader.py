@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import copy
+import os
 import threading
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List
 
 try:
     import yaml
@@ -13,7 +15,20 @@ except Exception:
 
 from cuga.observability import InMemoryTracer
 
-ALLOWED_SANDBOXES = {"py-slim", "py-full", "node-slim", "node-full", "orchestrator"}
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+# Sort on the precomputed (tier, id) key with a C-level getter rather than
+# the dataclass's field-by-field __lt__
+_ENTRY_SORT_KEY = attrgetter("sort_index")
+
+# Parsed registry documents keyed by (path, parser), reused while
+# (st_mtime_ns, st_size) is unchanged. Shared by every registry loader through
+# _stat_cached_load(); documents are handed out as-is and treated as read-only.
+_PARSE_CACHE: Dict[tuple[str, Callable[[Path], Any]], tuple[tuple[int, int], Any]] = {}
+
+ALLOWED_SANDBOXES = frozenset({"py-slim", "py-full", "node-slim", "node-full", "orchestrator"})
+ALLOWED_BUDGET_POLICIES = frozenset({"warn", "block"})
 DEFAULT_BUDGET_POLICY = "warn"
 REQUIRED_ENV_DEFAULTS = {
     "AGENT_BUDGET_CEILING": "${AGENT_BUDGET_CEILING:-100}",
@@ -27,7 +42,7 @@ REQUIRED_ENV_DEFAULTS = {
 }
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class RegistryEntry:
     sort_index: tuple = field(init=False, repr=False)
     id: str
@@ -49,18 +64,28 @@ class Registry:
         self.path = Path(path)
         self._lock = threading.Lock()
         self.tracer = tracer or InMemoryTracer()
-        self._entries = self._load(self.path.read_text())
+        self._entries = self._build_entries(_stat_cached_load(self.path, _read_registry_file))
 
     @staticmethod
     def _load(content: str) -> List[RegistryEntry]:
-        data = _safe_load(content)
+        return Registry._build_entries(_safe_load(content))
+
+    @staticmethod
+    def _build_entries(data: Dict[str, Any]) -> List[RegistryEntry]:
         defaults = data.get("defaults", {})
-        entries: List[RegistryEntry] = []
+        merged_entries: List[Dict[str, Any]] = []
         for raw in data.get("entries", []):
             merged = _merge_with_defaults(copy.deepcopy(defaults), raw)
             if merged.get("tier") == 2 and "enabled" not in raw:
                 merged["enabled"] = False
-            _validate_entry(merged)
+            merged_entries.append(merged)
+        # One set test for the whole registry; per-entry sandbox checks only run
+        # when it fails, so errors are still raised in entry order
+        check_sandbox = not {merged.get("sandbox") for merged in merged_entries} <= ALLOWED_SANDBOXES
+
+        entries: List[RegistryEntry] = []
+        for merged in merged_entries:
+            _validate_entry(merged, check_sandbox=check_sandbox)
             entry = RegistryEntry(
                 id=merged["id"],
                 ref=merged["ref"],
@@ -69,11 +94,12 @@ class Registry:
                 tier=merged.get("tier", 1),
                 env=merged.get("env", {}),
                 mounts=merged.get("mounts", []),
-                scopes=merged.get("scopes", []),
+                scopes=list(merged.get("scopes", [])),
                 budget_policy=merged.get("budget_policy", DEFAULT_BUDGET_POLICY),
             )
             entries.append(entry)
-        return sorted(entries)
+        entries.sort(key=_ENTRY_SORT_KEY)
+        return entries
 
     @property
     def entries(self) -> List[RegistryEntry]:
@@ -81,6 +107,7 @@ class Registry:
             return list(self._entries)
 
     def hot_reload(self, content: str) -> None:
+        _invalidate_parse_cache(self.path)
         new_entries = self._load(content)
         with self._lock:
             self._entries = new_entries
@@ -95,9 +122,39 @@ class Registry:
                 yield entry
 
 
+def _stat_cached_load(path: Path, parse: Callable[[Path], Any]) -> Any:
+    """Return ``parse(path)``, reusing the previous result while the file is unchanged.
+
+    Results are shared between calls and must be treated as read-only.
+    """
+
+    key = (os.fspath(path), parse)
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = parse(path)
+    _PARSE_CACHE[key] = (stamp, data)
+    return data
+
+
+def _invalidate_parse_cache(path: Path) -> None:
+    """Drop every cached parse of ``path``, whichever loader produced it."""
+
+    target = os.fspath(path)
+    stale = [key for key in list(_PARSE_CACHE) if key[0] == target]
+    for key in stale:
+        _PARSE_CACHE.pop(key, None)
+
+
+def _read_registry_file(path: Path) -> Dict[str, Any]:
+    return _safe_load(path.read_text())
+
+
 def _safe_load(content: str) -> Dict[str, Any]:
     if yaml:
-        return yaml.safe_load(content) or {}
+        return yaml.load(content, Loader=_YAML_LOADER) or {}
     try:
         from omegaconf import OmegaConf
 
@@ -227,12 +284,13 @@ def _merge_with_defaults(defaults: Dict[str, Any], raw: Dict[str, Any]) -> Dict[
     return merged
 
 
-def _validate_entry(entry: Dict[str, Any]) -> None:
-    sandbox = entry.get("sandbox")
-    if sandbox not in ALLOWED_SANDBOXES:
-        raise ValueError(f"Unsupported sandbox profile: {sandbox}")
+def _validate_entry(entry: Dict[str, Any], *, check_sandbox: bool = True) -> None:
+    if check_sandbox:
+        sandbox = entry.get("sandbox")
+        if sandbox not in ALLOWED_SANDBOXES:
+            raise ValueError(f"Unsupported sandbox profile: {sandbox}")
     budget_policy = entry.get("budget_policy", DEFAULT_BUDGET_POLICY)
-    if budget_policy not in {"warn", "block"}:
+    if budget_policy not in ALLOWED_BUDGET_POLICIES:
         raise ValueError(f"Invalid budget policy: {budget_policy}")
     scopes = entry.get("scopes", []) or []
     mounts = entry.get("mounts", []) or []
@@ -8,11 +8,37 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
+from cuga.registry.loader import _stat_cached_load
+
 from .models import RegistryServer
-from .schema import get_registry_validator, validate_registry_payload
+from .schema import (
+    _audit_logger_for,
+    get_fast_registry_validator,
+    get_registry_validator,
+    validate_registry_payload,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# C-accelerated parsers when available; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError so callers handle both the same way.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 class RegistryLoader:
+    """Load and validate registry servers from YAML or JSON.
+
+    Entries are checked with plain dict/type checks by default; pass
+    ``strict_schema=True`` to run the general JSON Schema engine instead
+    (for schemas the hand-rolled checks do not cover).
+    """
+
+    # Shared by every strict loader; built on first use by _schema_validator()
+    _SCHEMA_VALIDATOR: Any = None
+
     def __init__(
         self,
         path: Path,
@@ -20,39 +46,24 @@ class RegistryLoader:
         logger: logging.Logger | None = None,
         audit_context: dict[str, str] | None = None,
         fail_on_validation_error: bool = False,
+        strict_schema: bool = False,
     ) -> None:
         self.path = path
         self.logger = logger or logging.getLogger(__name__)
         self.audit_context = audit_context or {}
         self.fail_on_validation_error = fail_on_validation_error
+        self.strict_schema = strict_schema
+        # Static audit fields (operation, actor, ...) are bound once per loader
+        self._audit_logger = _audit_logger_for(self.logger, self.audit_context)
 
     def _load(self) -> List[RegistryServer]:
-        payload: Dict[str, Any] = {}
-
-        if self.path.exists():
-            content = self.path.read_text(encoding="utf-8")
-            suffix = self.path.suffix.lower()
-
-            if suffix in (".yaml", ".yml"):
-                yaml_spec = importlib.util.find_spec("yaml")
-                if yaml_spec:
-                    yaml = importlib.import_module("yaml")
-                    payload = yaml.safe_load(content) or {}
-                else:
-                    payload = self._fallback_yaml_load(content)
-            elif suffix == ".json":
-                try:
-                    payload = json.loads(content) or {}
-                except json.JSONDecodeError:  # pragma: no cover
-                    payload = {}
-
-        validator = get_registry_validator()
+        payload = self._read_payload()
+        validator = self._schema_validator() if self.strict_schema else get_fast_registry_validator()
         servers_payload = validate_registry_payload(
             payload,
             validator,
-            logger=self.logger,
-            audit_context=self.audit_context,
             fail_on_validation_error=self.fail_on_validation_error,
+            audit_logger=self._audit_logger,
         )
 
         servers: List[RegistryServer] = []
@@ -67,6 +78,18 @@ class RegistryLoader:
             )
         return servers
 
+    def _read_payload(self) -> Dict[str, Any]:
+        try:
+            return _stat_cached_load(self.path, _parse_payload)
+        except FileNotFoundError:
+            return {}
+
+    @classmethod
+    def _schema_validator(cls) -> Any:
+        if RegistryLoader._SCHEMA_VALIDATOR is None:
+            RegistryLoader._SCHEMA_VALIDATOR = get_registry_validator()
+        return RegistryLoader._SCHEMA_VALIDATOR
+
     @staticmethod
     def _fallback_yaml_load(content: str) -> Dict[str, Any]:
         payload: Dict[str, Any] = {}
@@ -116,4 +139,26 @@ class ToolRegistry:
         return [s for s in self.data if s.enabled]
 
 
+def _parse_payload(path: Path) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {}
+    # Both parsers take UTF-8 bytes directly, skipping a decode to str
+    content = path.read_bytes()
+    suffix = path.suffix.lower()
+
+    if suffix in (".yaml", ".yml"):
+        yaml_spec = importlib.util.find_spec("yaml")
+        if yaml_spec:
+            yaml = importlib.import_module("yaml")
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            payload = yaml.load(content, Loader=loader) or {}
+        else:
+            payload = RegistryLoader._fallback_yaml_load(content.decode("utf-8"))
+    elif suffix == ".json":
+        try:
+            payload = _json_loads(content) or {}
+        except json.JSONDecodeError:  # pragma: no cover
+            payload = {}
+    return payload
+
+
 __all__ = ["RegistryLoader", "ToolRegistry", "RegistryServer"]
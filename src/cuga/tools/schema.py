@@ -1,8 +1,9 @@
 """Schema validation utilities for the tool registry.
 
-Design: validation uses ``jsonschema`` errors as the single source of truth and
-emits structured audit logs with sanitized fields (no payload echoes) so callers
-can trace outcomes without leaking sensitive values.
+Design: validation errors are Draft7-shaped (from ``jsonschema`` or the
+hand-rolled registry checks, which mirror it) and feed structured audit logs
+with sanitized fields (no payload echoes) so callers can trace outcomes
+without leaking sensitive values.
 """
 
 from __future__ import annotations
@@ -11,6 +12,11 @@ import importlib.util
 import logging
 from typing import Any, Dict, List, Mapping, MutableMapping, Set
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
+
 _SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "type": "object",
@@ -31,8 +37,21 @@ _SCHEMA = {
     },
 }
 
+# Code-generated validator compiled once at import. It only answers "is the
+# payload valid"; error details still come from the Draft7/lightweight
+# validator, which only runs when this check fails.
+_FAST_VALIDATE = fastjsonschema.compile(_SCHEMA) if fastjsonschema is not None else None
+
 _AUDIT_OPERATION = "registry_schema_validation"
-_AUDIT_RESERVED_EXTRA_KEYS = {"event", "operation", "outcome"}
+
+# Audit event names and outcomes, shared by every record built below
+_EVENT_SUMMARY = _AUDIT_OPERATION
+_EVENT_VIOLATION = "registry_schema_violation"
+_EVENT_INVALID = "registry_schema_invalid"
+_EVENT_ERROR = "registry_schema_validation_error"
+_OUTCOME_SUCCESS = "success"
+_OUTCOME_PARTIAL = "partial"
+_OUTCOME_FAILURE = "failure"
 _AUDIT_CONTEXT_ALLOWED_KEYS = {"actor", "correlation_id", "principal"}
 
 
@@ -53,16 +72,25 @@ class _SimpleError:
 
 
 class _LightweightValidator:
-    """Fallback validator when ``jsonschema`` is unavailable.
+    """Hand-rolled validator for the registry schema.
 
-    This only implements the subset of Draft7 needed for the registry schema so
-    validation and audit logs remain consistent in offline environments.
+    Plain ``isinstance``/key checks covering the whole registry schema, with
+    errors shaped like Draft7's (same paths, schema paths and order) so audit
+    logs are identical whichever validator runs. Used by default and as the
+    fallback when ``jsonschema`` is unavailable.
     """
 
-    def iter_errors(self, payload: Mapping[str, Any]):
-        servers = payload.get("servers")
-        if servers is None:
+    schema = _SCHEMA
+
+    _ITEM_PATH = ["properties", "servers", "items"]
+    _ITEM_SCHEMA = _SCHEMA["properties"]["servers"]["items"]
+
+    def iter_errors(self, payload: Any):
+        if not isinstance(payload, Mapping):
+            return [_SimpleError([], ["type"], "type", "object", _SCHEMA)]
+        if "servers" not in payload:
             return []
+        servers = payload["servers"]
         if not isinstance(servers, list):
             return [
                 _SimpleError(
@@ -80,65 +108,156 @@ class _LightweightValidator:
                 errors.append(
                     _SimpleError(
                         ["servers", idx],
-                        ["properties", "servers", "items", "type"],
+                        [*self._ITEM_PATH, "type"],
                         "type",
                         "object",
                         {"type": "object"},
                     )
                 )
                 continue
+            errors.extend(self._item_errors(idx, item))
+        return errors
 
-            for field in ("id", "url"):
-                if field not in item or item[field] is None:
-                    errors.append(
-                        _SimpleError(
-                            ["servers", idx],
-                            ["properties", "servers", "items", "required"],
-                            "required",
-                            ["id", "url"],
-                            {"required": ["id", "url"]},
-                        )
+    def _item_errors(self, idx: int, item: Mapping[str, Any]) -> List[_SimpleError]:
+        errors: List[_SimpleError] = []
+        required = self._ITEM_SCHEMA["required"]
+        for field in required:
+            if field not in item:
+                errors.append(
+                    _SimpleError(
+                        ["servers", idx],
+                        [*self._ITEM_PATH, "required"],
+                        "required",
+                        required,
+                        self._ITEM_SCHEMA,
                     )
-                    break
+                )
+
+        for field, field_schema in self._ITEM_SCHEMA["properties"].items():
+            if field not in item:
+                continue
+            value = item[field]
+            expected = field_schema["type"]
+            if not _is_type(value, expected):
+                errors.append(
+                    _SimpleError(
+                        ["servers", idx, field],
+                        [*self._ITEM_PATH, "properties", field, "type"],
+                        "type",
+                        expected,
+                        field_schema,
+                    )
+                )
+            minimum = field_schema.get("minimum")
+            if minimum is not None and _is_type(value, "number") and value < minimum:
+                errors.append(
+                    _SimpleError(
+                        ["servers", idx, field],
+                        [*self._ITEM_PATH, "properties", field, "minimum"],
+                        "minimum",
+                        minimum,
+                        field_schema,
+                    )
+                )
         return errors
 
 
+def _is_type(value: Any, expected: str) -> bool:
+    """JSON Schema type check; booleans are not numbers, 1.0 is an integer."""
+
+    if expected == "string":
+        return isinstance(value, str)
+    if expected == "boolean":
+        return isinstance(value, bool)
+    if isinstance(value, bool):
+        return False
+    if expected == "integer":
+        return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+    if expected == "number":
+        return isinstance(value, (int, float))
+    return True
+
+
+# Shared instance; the validator holds no per-call state
+_LIGHTWEIGHT_VALIDATOR = _LightweightValidator()
+
+
+def get_fast_registry_validator() -> Any:
+    """Return the shared hand-rolled validator for the registry schema."""
+
+    return _LIGHTWEIGHT_VALIDATOR
+
+
 def get_registry_validator() -> Any:
+    """Build a validator for the registry schema.
+
+    Construction checks the schema itself, so callers on hot paths should
+    build once and reuse the result (see ``RegistryLoader``).
+    """
+
     if importlib.util.find_spec("jsonschema"):
-        from jsonschema import Draft7Validator  # type: ignore
+        from jsonschema.validators import validator_for  # type: ignore
 
-        return Draft7Validator(_SCHEMA)
-    return _LightweightValidator()
+        validator_cls = validator_for(_SCHEMA)
+        validator_cls.check_schema(_SCHEMA)
+        return validator_cls(_SCHEMA)
+    return _LIGHTWEIGHT_VALIDATOR
 
 
-def _build_audit_extra(
-    event: str,
-    *,
-    outcome: str,
-    audit_context: Mapping[str, Any] | None = None,
-    details: Mapping[str, Any] | None = None,
-    **details_kwargs: Any,
-) -> Dict[str, Any]:
-    extra: Dict[str, Any] = {"event": event, "operation": _AUDIT_OPERATION, "outcome": outcome}
+def _collect_errors(payload: Mapping[str, Any], validator: Any) -> List[Any]:
+    """Return schema errors, skipping error collection for valid payloads.
+
+    The precompiled fast path only applies to validators built for the
+    registry schema; any other validator is always run in full.
+    """
+
+    if _FAST_VALIDATE is not None and getattr(validator, "schema", None) is _SCHEMA:
+        try:
+            _FAST_VALIDATE(payload)
+        except fastjsonschema.JsonSchemaException:
+            pass
+        else:
+            return []
+    return list(validator.iter_errors(payload))
+
+
+class _AuditLogger(logging.LoggerAdapter):
+    """Logger adapter pre-bound with the static audit fields of one context.
+
+    The operation and allowed audit-context keys are composed once per
+    context; each record only adds its event, outcome and details.
+    """
+
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> tuple[Any, MutableMapping[str, Any]]:
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        return msg, kwargs
+
+    def audit(self, level: int, event: str, *, outcome: str, **details: Any) -> None:
+        self.log(level, event, extra={**details, "event": event, "outcome": outcome})
+
+    def is_consumed(self, level: int) -> bool:
+        """Return True when a record at ``level`` would reach some handler.
+
+        Records with no handler anywhere up the hierarchy are dropped by
+        ``logging`` (bar the ``lastResort`` stderr fallback), so callers can
+        skip assembling their details entirely.
+        """
+
+        if not self.isEnabledFor(level):
+            return False
+        if self.logger.hasHandlers():
+            return True
+        return logging.lastResort is not None and level >= logging.lastResort.level
+
+
+def _audit_logger_for(logger: logging.Logger, audit_context: Mapping[str, Any] | None) -> _AuditLogger:
+    static: Dict[str, Any] = {"operation": _AUDIT_OPERATION}
     if audit_context:
         for key in _AUDIT_CONTEXT_ALLOWED_KEYS:
             value = audit_context.get(key)
             if value:
-                extra[key] = value
-
-    combined_details: Dict[str, Any] = {}
-    if details:
-        combined_details.update(details)
-    if details_kwargs:
-        combined_details.update(details_kwargs)
-
-    filtered_details: Dict[str, Any] = {}
-    if combined_details:
-        filtered_details = {k: v for k, v in combined_details.items() if k not in _AUDIT_RESERVED_EXTRA_KEYS}
-
-    if filtered_details:
-        extra.update(filtered_details)
-    return extra
+                static[key] = value
+    return _AuditLogger(logger, static)
 
 
 def _sanitize_error(err: Any) -> MutableMapping[str, Any]:
@@ -168,6 +287,19 @@ def _invalid_indices_from_errors(errors: List[Any]) -> Set[int]:
     return invalid
 
 
+def _log_validation_summary(audit: _AuditLogger, outcome: str, *, accepted: int, rejected: int) -> None:
+    if not audit.is_consumed(logging.INFO):
+        return
+    audit.audit(
+        logging.INFO,
+        _EVENT_SUMMARY,
+        outcome=outcome,
+        accepted=accepted,
+        rejected=rejected,
+        total=accepted + rejected,
+    )
+
+
 def validate_registry_payload(
     payload: Dict[str, Any],
     validator: Any,
@@ -175,43 +307,37 @@ def validate_registry_payload(
     *,
     audit_context: Mapping[str, Any] | None = None,
     fail_on_validation_error: bool = False,
+    audit_logger: _AuditLogger | None = None,
 ) -> List[Dict[str, Any]]:
     """Validate registry payload using Draft7 with defensive fallbacks.
 
     Validation errors are logged with audit metadata. Only structural diagnostics
-    are emitted; payload values are never echoed.
+    are emitted; payload values are never echoed. Callers validating repeatedly
+    for one context can pass a prebuilt ``audit_logger`` (see
+    ``RegistryLoader``) instead of ``logger``/``audit_context``.
     """
 
-    logger = logger or logging.getLogger(__name__)
-    audit_context = audit_context or {}
+    audit = audit_logger or _audit_logger_for(logger or logging.getLogger(__name__), audit_context)
     validation_errors: List[Any] = []
 
-    try:
-        validation_errors = list(validator.iter_errors(payload))
-    except Exception as exc:  # pragma: no cover - defensive guard
-        logger.error(
-            "registry_schema_validation_error",
-            extra=_build_audit_extra(
-                "registry_schema_validation_error",
-                outcome="failure",
-                audit_context=audit_context,
-                error_type=type(exc).__name__,
-            ),
-        )
+    # Fast-fail on a malformed container before walking per-entry errors;
+    # the offending value is never formatted into a log record.
+    servers = payload.get("servers", []) if isinstance(payload, Mapping) else None
+    if not isinstance(servers, list):
+        audit.audit(logging.WARNING, _EVENT_INVALID, outcome=_OUTCOME_FAILURE, reason="servers_not_list")
+        _log_validation_summary(audit, _OUTCOME_FAILURE, accepted=0, rejected=0)
         if fail_on_validation_error:
             raise ValueError("Invalid registry schema") from None
         return []
 
-    servers = payload.get("servers", [])
-    if not isinstance(servers, list):
-        logger.warning(
-            "registry_schema_invalid",
-            extra=_build_audit_extra(
-                "registry_schema_invalid",
-                outcome="failure",
-                audit_context=audit_context,
-                reason="servers_not_list",
-            ),
+    try:
+        validation_errors = _collect_errors(payload, validator)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        audit.audit(
+            logging.ERROR,
+            _EVENT_ERROR,
+            outcome=_OUTCOME_FAILURE,
+            error_type=type(exc).__name__,
         )
         if fail_on_validation_error:
             raise ValueError("Invalid registry schema") from None
@@ -219,42 +345,27 @@ def validate_registry_payload(
 
     invalid_indices: Set[int] = _invalid_indices_from_errors(validation_errors)
 
-    for err in validation_errors:
-        sanitized = _sanitize_error(err)
-        logger.warning(
-            "registry_schema_violation",
-            extra=_build_audit_extra(
-                "registry_schema_violation",
-                outcome="failure",
-                audit_context=audit_context,
-                **sanitized,
-            ),
-        )
+    # Sanitizing copies each error's paths; skip it when violations would be dropped
+    if validation_errors and audit.is_consumed(logging.WARNING):
+        for err in validation_errors:
+            audit.audit(logging.WARNING, _EVENT_VIOLATION, outcome=_OUTCOME_FAILURE, **_sanitize_error(err))
 
     filtered: List[Dict[str, Any]] = []
+    rejected = 0
     for idx, raw in enumerate(servers):
-        if idx in invalid_indices:
+        if idx in invalid_indices or not isinstance(raw, dict):
+            rejected += 1
             continue
-        if isinstance(raw, dict):
-            filtered.append(raw)
-
-    outcome = "success"
-    if validation_errors and filtered:
-        outcome = "partial"
-    elif validation_errors and not filtered:
-        outcome = "failure"
-
-    logger.info(
-        "registry_schema_validation",
-        extra=_build_audit_extra(
-            "registry_schema_validation",
-            outcome=outcome,
-            audit_context=audit_context,
-            accepted=len(filtered),
-            rejected=len(servers) - len(filtered),
-            total=len(servers),
-        ),
-    )
+        filtered.append(raw)
+    accepted = len(filtered)
+
+    outcome = _OUTCOME_SUCCESS
+    if validation_errors and accepted:
+        outcome = _OUTCOME_PARTIAL
+    elif validation_errors and not accepted:
+        outcome = _OUTCOME_FAILURE
+
+    _log_validation_summary(audit, outcome, accepted=accepted, rejected=rejected)
 
     if fail_on_validation_error and validation_errors:
         raise ValueError("Invalid registry schema") from None
@@ -16,31 +16,71 @@ Following AGENTS.md testing invariants:
 """
 
 import asyncio
+import logging
 import sys
+from collections import namedtuple
 from pathlib import Path
-from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 import yaml
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from cuga.modular.tools.sales.account_intelligence import score_account_fit
+from cuga.modular.tools.sales.outreach import assess_message_quality, draft_outbound_message
+from cuga.modular.tools.sales.qualification import qualify_opportunity
 from cuga.orchestrator.intelligent_planner import IntelligentPlanner
 from cuga.orchestrator.planning import Plan, PlanStep, PlanningStage, ToolBudget
 from cuga.orchestrator.protocol import ExecutionContext
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@pytest.fixture
-def registry():
-    """Load test registry."""
-    registry_path = Path(__file__).parent.parent.parent / "registry.yaml"
-    with open(registry_path) as f:
-        return yaml.safe_load(f)
 
+REGISTRY_PATH = Path(__file__).parent.parent.parent / "registry.yaml"
+_REGISTRY_CACHE_KEY = "cuga/production_demo/registry"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def registry(request):
+    """Load test registry.
+    
+    registry.yaml stays the source of truth; its parsed form is kept as JSON
+    in the pytest cache and reused while the file's mtime/size are unchanged.
+    """
+    stat = REGISTRY_PATH.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache = getattr(request.config, "cache", None)
+    
+    if cache is not None:
+        cached = cache.get(_REGISTRY_CACHE_KEY, None)
+        if cached and cached.get("stamp") == stamp:
+            return cached["registry"]
+    
+    with open(REGISTRY_PATH, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    
+    if cache is not None:
+        cache.set(_REGISTRY_CACHE_KEY, {"stamp": stamp, "registry": data})
+    return data
+
+
+@pytest.fixture(scope="session")
+def required_inputs_by_tool(registry):
+    """Required input names per registry tool, computed once per session."""
+    return {
+        name: [
+            input_name
+            for input_name, input_spec in config.get("inputs", {}).items()
+            if input_spec.get("required", False)
+        ]
+        for name, config in registry["tools"].items()
+    }
+
+
+@pytest.fixture(scope="module")
 def execution_context():
     """Create test execution context."""
     return ExecutionContext(
@@ -55,7 +95,7 @@ def execution_context():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def prospect_data():
     """Standard prospect data for tests."""
     return {
@@ -75,141 +115,157 @@ def prospect_data():
     }
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def demo_plan(registry, execution_context, prospect_data):
+    """Deterministic rule-based plan, built once and shared by tests that only inspect it."""
+    planner = IntelligentPlanner(registry, profile="demo")
+    return await planner.create_plan(
+        goal="Prioritize and engage prospect",
+        context=execution_context,
+        prospect_data=prospect_data,
+        use_llm=False,
+    )
+
+
+def _index_plan(plan: Plan) -> dict[str, PlanStep]:
+    """Index plan steps by tool name for O(1) lookup."""
+    return {step.tool: step for step in plan.steps}
+
+
+PlanFacts = namedtuple(
+    "PlanFacts", "domains tools by_tool costs side_effects depends_on"
+)
+
+DEMO_DOMAINS = {"intelligence", "engagement", "qualification"}
+
+
+def _plan_facts(plan: Plan) -> PlanFacts:
+    """Derive the facts tests inspect from a demo plan.
+    
+    Only computes; missing metadata shows up as None so the tests that own
+    each invariant report it, rather than the fixture erroring.
+    """
+    by_tool = _index_plan(plan)
+    return PlanFacts(
+        domains=[step.metadata.get("domain") for step in plan.steps],
+        tools=[step.tool for step in plan.steps],
+        by_tool=by_tool,
+        costs={tool: step.estimated_cost for tool, step in by_tool.items()},
+        side_effects={
+            tool: step.metadata.get("side_effect_class") for tool, step in by_tool.items()
+        },
+        depends_on={
+            tool: step.metadata.get("depends_on") for tool, step in by_tool.items()
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def plan_facts(demo_plan):
+    """Facts about the demo plan (computed once per module)."""
+    return _plan_facts(demo_plan)
+
+
+@pytest.fixture(scope="module")
+def demo_steps(plan_facts):
+    """Steps of the demo plan keyed by tool name."""
+    return plan_facts.by_tool
+
+
+# Sales tools run by the demo plan, keyed by registry tool name
+SALES_TOOLS = {
+    "score_account_fit": score_account_fit,
+    "draft_outbound_message": draft_outbound_message,
+    "assess_message_quality": assess_message_quality,
+    "qualify_opportunity": qualify_opportunity,
+}
+
+
 class TestMultiDomainOrchestration:
     """Test complete multi-domain orchestration flows."""
     
-    @pytest.mark.asyncio
-    async def test_successful_four_step_execution(
-        self, registry, execution_context, prospect_data
+    def test_successful_four_step_execution(
+        self, demo_plan, plan_facts, execution_context
     ):
         """Test successful execution of all 4 steps across 3 domains."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        # Create plan (offline mode)
-        plan = await planner.create_plan(
-            goal="Prioritize and engage prospect",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,  # Deterministic
-        )
-        
-        # Validate plan structure
-        assert len(plan.steps) == 4
-        assert plan.trace_id == execution_context.trace_id
-        assert plan.profile == "demo"
+        assert len(demo_plan.steps) == 4
+        assert demo_plan.trace_id == execution_context.trace_id
+        assert demo_plan.profile == "demo"
         
         # Validate domains
-        domains = [s.metadata["domain"] for s in plan.steps]
-        assert "intelligence" in domains
-        assert "engagement" in domains
-        assert "qualification" in domains
+        assert DEMO_DOMAINS <= set(plan_facts.domains)
         
         # Validate step ordering (intelligence → engagement → qualification)
-        assert plan.steps[0].metadata["domain"] == "intelligence"
-        assert plan.steps[1].metadata["domain"] == "engagement"
+        assert plan_facts.domains[0] == "intelligence"
+        assert plan_facts.domains[1] == "engagement"
         
-    @pytest.mark.asyncio
-    async def test_cross_step_context_passing(
-        self, registry, execution_context, prospect_data
-    ):
+    def test_cross_step_context_passing(self, demo_steps, plan_facts):
         """Test that step 2 output flows to step 3 input."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        plan = await planner.create_plan(
-            goal="Draft and validate message",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
-        # Find draft and assess steps
-        draft_step = next(s for s in plan.steps if s.tool == "draft_outbound_message")
-        assess_step = next(s for s in plan.steps if s.tool == "assess_message_quality")
+        assess_step = demo_steps["assess_message_quality"]
         
         # Validate dependency metadata
-        assert assess_step.metadata.get("depends_on") == 2
+        assert plan_facts.depends_on["assess_message_quality"] == 2
         
         # Validate assess step expects empty inputs (to be filled at runtime)
         assert assess_step.input["message"] == ""
         assert assess_step.input["subject"] == ""
         
-    @pytest.mark.asyncio
-    async def test_trace_id_continuity(
-        self, registry, execution_context, prospect_data
-    ):
+    def test_trace_id_continuity(self, demo_plan, execution_context, caplog):
         """Test trace_id propagates through all steps."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        plan = await planner.create_plan(
-            goal="Test trace continuity",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
         # Plan inherits trace_id
-        assert plan.trace_id == execution_context.trace_id
-        
-        # All steps would use same trace in execution
-        # (verified by checking logs in production demo)
-        for step in plan.steps:
-            assert "domain" in step.metadata
-            assert "side_effect_class" in step.metadata
+        assert demo_plan.trace_id == execution_context.trace_id
+        
+        # Run each step's tool with the plan's trace context, as the demo
+        # does, and check every trace-tagged record carries the context's id
+        tool_context = {"trace_id": demo_plan.trace_id, "profile": demo_plan.profile}
+        outputs = {}
+        for step in demo_plan.steps:
+            step_input = dict(step.input)
+            depends_on = step.metadata.get("depends_on")
+            if depends_on in outputs:
+                step_input["message"] = outputs[depends_on]["message_draft"]
+                step_input["subject"] = outputs[depends_on]["subject"]
+            
+            caplog.clear()
+            with caplog.at_level(logging.INFO):
+                outputs[step.index] = SALES_TOOLS[step.tool](step_input, tool_context)
+            
+            traced = [r.getMessage() for r in caplog.records if r.getMessage().startswith("[")]
+            assert traced, f"Step {step.index} ({step.tool}) logged no trace-tagged record"
+            for message in traced:
+                assert message.startswith(f"[{execution_context.trace_id}]"), (
+                    f"Step {step.index} ({step.tool}) logged under another trace: {message}"
+                )
 
 
 class TestBudgetEnforcement:
     """Test budget tracking and enforcement."""
     
-    @pytest.mark.asyncio
-    async def test_budget_limit_set_correctly(
-        self, registry, execution_context, prospect_data
-    ):
+    def test_budget_limit_set_correctly(self, demo_plan, plan_facts):
         """Test plan has budget limit from registry."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        plan = await planner.create_plan(
-            goal="Test budget",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
         # Check budget is set
-        assert plan.budget is not None
-        assert plan.budget.call_ceiling > 0
+        assert demo_plan.budget is not None
+        assert demo_plan.budget.call_ceiling > 0
         
         # Total cost should be under budget
-        total_cost = sum(s.estimated_cost for s in plan.steps)
-        assert total_cost <= plan.budget.call_ceiling
-        
-    @pytest.mark.asyncio
-    async def test_individual_step_costs(
-        self, registry, execution_context, prospect_data
-    ):
+        assert sum(plan_facts.costs.values()) <= demo_plan.budget.call_ceiling
+        
+    @pytest.mark.parametrize(
+        "tool,expected_cost",
+        [
+            ("score_account_fit", 0.5),
+            ("draft_outbound_message", 1.0),
+            ("assess_message_quality", 0.5),
+            ("qualify_opportunity", 0.7),
+        ],
+    )
+    def test_individual_step_costs(self, plan_facts, tool, expected_cost):
         """Test each step has reasonable cost estimate."""
-        planner = IntelligentPlanner(registry, profile="demo")
+        cost = plan_facts.costs[tool]
         
-        plan = await planner.create_plan(
-            goal="Test costs",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
-        for step in plan.steps:
-            # Cost should be positive and reasonable (0.1-2.0)
-            assert step.estimated_cost > 0
-            assert step.estimated_cost <= 2.0
-            
-            # Different tools should have different costs
-            if step.tool == "score_account_fit":
-                assert step.estimated_cost == 0.5
-            elif step.tool == "draft_outbound_message":
-                assert step.estimated_cost == 1.0
-            elif step.tool == "assess_message_quality":
-                assert step.estimated_cost == 0.5
-            elif step.tool == "qualify_opportunity":
-                assert step.estimated_cost == 0.7
+        # Cost should be positive and reasonable (0.1-2.0)
+        assert 0 < cost <= 2.0
+        assert cost == expected_cost
     
     def test_budget_exhaustion_scenario(self, registry):
         """Test what happens when budget would be exceeded."""
@@ -266,54 +322,23 @@ class TestBudgetEnforcement:
 class TestApprovalFlows:
     """Test human approval flows."""
     
-    @pytest.mark.asyncio
-    async def test_propose_operations_require_approval(
-        self, registry, execution_context, prospect_data
-    ):
-        """Test operations with side_effect_class=propose require approval."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        plan = await planner.create_plan(
-            goal="Draft message",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
-        # Find draft_outbound_message step
-        draft_step = next(s for s in plan.steps if s.tool == "draft_outbound_message")
-        
-        # Verify it's marked as propose
-        assert draft_step.metadata["side_effect_class"] == "propose"
-        
-        # In execution, this would trigger approval flow
-        # (verified by production demo logs showing approval requests)
-    
-    @pytest.mark.asyncio
-    async def test_read_only_operations_no_approval(
-        self, registry, execution_context, prospect_data
-    ):
-        """Test read-only operations don't require approval."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        plan = await planner.create_plan(
-            goal="Score account",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
-        # Find read-only steps
-        read_only_steps = [
-            s for s in plan.steps 
-            if s.metadata["side_effect_class"] == "read-only"
-        ]
-        
-        assert len(read_only_steps) >= 2  # score_account_fit, assess_message_quality
-        
-        # These steps should execute without approval
-        for step in read_only_steps:
-            assert step.metadata["side_effect_class"] == "read-only"
+    @pytest.mark.parametrize(
+        "tool,expected_class",
+        [
+            ("score_account_fit", "read-only"),
+            ("draft_outbound_message", "propose"),
+            ("assess_message_quality", "read-only"),
+            ("qualify_opportunity", "read-only"),
+        ],
+    )
+    def test_side_effect_class(self, plan_facts, tool, expected_class):
+        """Test propose operations require approval and read-only ones don't.
+        
+        Steps with side_effect_class=propose trigger the approval flow in
+        execution (verified by production demo logs showing approval
+        requests); read-only steps execute without approval.
+        """
+        assert plan_facts.side_effects[tool] == expected_class
 
 
 class TestFailureRecovery:
@@ -379,60 +404,32 @@ class TestFailureRecovery:
 class TestToolContracts:
     """Test tool input/output contracts."""
     
-    @pytest.mark.asyncio
-    async def test_all_tools_have_required_metadata(
-        self, registry, execution_context, prospect_data
-    ):
+    def test_all_tools_have_required_metadata(self, demo_plan):
         """Test all plan steps have required metadata fields."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        plan = await planner.create_plan(
-            goal="Test metadata",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
-        required_fields = ["domain", "side_effect_class"]
-        
-        for step in plan.steps:
-            for field in required_fields:
-                assert field in step.metadata, f"Step {step.index} missing {field}"
-            
-            # Validate side_effect_class values
-            assert step.metadata["side_effect_class"] in [
-                "read-only", "propose", "execute"
-            ]
+        for step in demo_plan.steps:
+            assert "domain" in step.metadata, f"Step {step.index} missing domain"
+            assert "side_effect_class" in step.metadata, (
+                f"Step {step.index} missing side_effect_class"
+            )
+            assert step.metadata["side_effect_class"] in ["read-only", "propose", "execute"], step.tool
     
-    @pytest.mark.asyncio
-    async def test_tool_inputs_match_registry(self, registry, execution_context, prospect_data):
+    def test_tool_inputs_match_registry(self, demo_plan, required_inputs_by_tool):
         """Test plan step inputs match tool definitions in registry."""
-        planner = IntelligentPlanner(registry, profile="demo")
-        
-        plan = await planner.create_plan(
-            goal="Test inputs",
-            context=execution_context,
-            prospect_data=prospect_data,
-            use_llm=False,
-        )
-        
-        for step in plan.steps:
-            tool_config = registry["tools"].get(step.tool)
-            if not tool_config:
+        for step in demo_plan.steps:
+            required_inputs = required_inputs_by_tool.get(step.tool)
+            if required_inputs is None:
                 continue
             
             # Check that step has input dict
             assert isinstance(step.input, dict)
             
-            # Validate required inputs are present
-            required_inputs = tool_config.get("inputs", {})
-            for input_name, input_spec in required_inputs.items():
-                if input_spec.get("required", False):
-                    # Either present in step.input or filled at runtime (empty string)
-                    assert (
-                        input_name in step.input or
-                        step.metadata.get("depends_on") is not None
-                    ), f"Missing required input '{input_name}' for {step.tool}"
+            # Required inputs are either present in step.input or filled at
+            # runtime from a dependency (empty string)
+            depends_on = step.metadata.get("depends_on")
+            for input_name in required_inputs:
+                assert (
+                    input_name in step.input or depends_on is not None
+                ), f"Missing required input '{input_name}' for {step.tool}"
 
 
 class TestProfileEnforcement:
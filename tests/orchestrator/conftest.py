@@ -0,0 +1,32 @@
+"""
+Shared fixtures for orchestrator tests.
+
+Async tests run their event loop with the eager task factory (Python 3.12+)
+so planner coroutines that resolve synchronously complete without a loop
+round-trip, matching production once eager mode is enabled there.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def _eager_task_factory():
+    """Install the eager task factory on the running test loop."""
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(previous)
+
+
+@pytest.fixture(autouse=True)
+def eager_asyncio_tests(request):
+    """Run `@pytest.mark.asyncio` tests under the eager task factory."""
+    if (
+        request.node.get_closest_marker("asyncio") is not None
+        and hasattr(asyncio, "eager_task_factory")
+    ):
+        request.getfixturevalue("_eager_task_factory")
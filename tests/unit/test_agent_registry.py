@@ -0,0 +1,54 @@
+"""
+tests/unit/test_agent_registry.py
+
+Tests for the profile-aware cuga.agents.registry.ToolRegistry:
+- Cached sorted profile order and its invalidation on register()
+- Planner profile selection following the refreshed order
+"""
+
+from cuga.agents.planner import Planner
+from cuga.agents.registry import ToolRegistry
+
+
+def _handler(**_kwargs):
+    return None
+
+
+# ============================================================================
+# Sorted Profile Cache Tests
+# ============================================================================
+
+
+def test_registration_after_sorted_profiles_refreshes_order():
+    registry = ToolRegistry()
+    registry.register("sales", "score_account", _handler)
+    assert registry.sorted_profiles() == ["sales"]
+
+    registry.register("analytics", "summarize", _handler)
+    registry.register("support", "triage", _handler)
+
+    assert registry.sorted_profiles() == ["analytics", "sales", "support"]
+
+
+def test_planner_sees_profile_registered_after_cached_order():
+    registry = ToolRegistry()
+    planner = Planner()
+    registry.register("sales", "score_account", _handler)
+    first = planner.plan("qualify", registry)
+    assert first.profile == "sales"
+
+    registry.register("analytics", "summarize", _handler)
+    second = planner.plan("qualify", registry)
+
+    assert second.profile == "analytics"
+    assert [step.tool for step in second.steps] == ["summarize"]
+    assert second.trace[0] == "Selected profile 'analytics' from 2 available profiles"
+
+
+def test_mutating_returned_profiles_does_not_corrupt_cache():
+    registry = ToolRegistry()
+    registry.register("sales", "score_account", _handler)
+
+    registry.sorted_profiles().append("injected")
+
+    assert registry.sorted_profiles() == ["sales"]
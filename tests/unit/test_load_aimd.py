@@ -0,0 +1,89 @@
+"""
+tests/unit/test_load_aimd.py
+
+Tests for the AIMD concurrency search in tests/load/test_concurrent_execution.py:
+- Increase/backoff step rule
+- Search loop driven by stubbed measurement windows
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.load.test_concurrent_execution import LoadTester, aimd_next_concurrency  # noqa: E402
+
+
+# ============================================================================
+# Step Rule Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ("concurrency", "within_slo", "max_sustainable", "expected"),
+    [
+        pytest.param(4, True, 4, 8, id="increase-doubles"),
+        pytest.param(200, True, 200, 256, id="increase-capped"),
+        pytest.param(256, True, 256, None, id="stop-at-cap"),
+        pytest.param(16, False, 4, 8, id="backoff-halves"),
+        pytest.param(16, False, 8, None, id="stop-on-sustained-level"),
+        pytest.param(1, False, 0, 1, id="backoff-floor"),
+    ],
+)
+def test_aimd_next_concurrency(concurrency, within_slo, max_sustainable, expected):
+    assert aimd_next_concurrency(concurrency, within_slo, max_sustainable, 256) == expected
+
+
+# ============================================================================
+# Search Loop Tests
+# ============================================================================
+
+
+class _StubWindowTester(LoadTester):
+    """LoadTester whose windows report a P99 of 100ms per in-flight execution."""
+
+    def __init__(self, failing_at=()):
+        self.failing_at = set(failing_at)
+        self.windows = []
+
+    async def run_window(self, concurrency, window_seconds, execution_ids):
+        self.windows.append(concurrency)
+        return {
+            "concurrency": concurrency,
+            "success_count": concurrency,
+            "failure_count": int(concurrency in self.failing_at),
+            "p99": concurrency * 100.0,
+        }
+
+
+@pytest.mark.asyncio
+async def test_search_doubles_then_backs_off_to_sustained_level():
+    tester = _StubWindowTester()
+
+    result = await tester.run_aimd(1000.0, initial_concurrency=4, window_seconds=0)
+
+    assert tester.windows == [4, 8, 16]
+    assert result["max_sustainable_concurrency"] == 8
+    assert [step["within_slo"] for step in result["steps"]] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_failed_window_counts_as_violation():
+    tester = _StubWindowTester(failing_at={8})
+
+    result = await tester.run_aimd(1000.0, initial_concurrency=4, window_seconds=0)
+
+    assert tester.windows == [4, 8]
+    assert result["max_sustainable_concurrency"] == 4
+
+
+@pytest.mark.asyncio
+async def test_search_stops_at_max_concurrency():
+    tester = _StubWindowTester()
+
+    result = await tester.run_aimd(10_000.0, initial_concurrency=4, max_concurrency=12, window_seconds=0)
+
+    assert tester.windows == [4, 8, 12]
+    assert result["max_sustainable_concurrency"] == 12
@@ -0,0 +1,165 @@
+"""
+tests/unit/test_mcp_registry_loader.py
+
+Tests for the MCP v2 registry loader (cuga.mcp_v2.registry.loader):
+- Fragments loaded on the thread pool merge in `defaults` order
+- Duplicate servers across fragments name the conflicting files
+- Snapshots isolated from the shared parse cache
+"""
+
+import time
+
+import pytest
+
+from cuga.mcp_v2.registry import loader as mcp_loader
+from cuga.mcp_v2.registry.errors import RegistryMergeError
+from cuga.mcp_v2.registry.loader import load_mcp_registry_snapshot
+from cuga.registry import loader as registry_loader
+
+
+@pytest.fixture(autouse=True)
+def fragment_loading(monkeypatch):
+    # Exercise the built-in fragment loader even where Hydra/OmegaConf exists
+    monkeypatch.setattr(mcp_loader, "load_registry_config", None)
+    monkeypatch.setattr(registry_loader, "_PARSE_CACHE", {})
+
+
+def _server_yaml(*names):
+    lines = ["servers:"]
+    for name in names:
+        lines += [f"  {name}:", f"    url: https://{name}.example.com"]
+    return "\n".join(lines) + "\n"
+
+
+def _write_registry(tmp_path, defaults, fragments, base_servers=("base",)):
+    base = tmp_path / "mcp.yaml"
+    base.write_text(
+        "defaults:\n" + "".join(f"  - {entry}\n" for entry in defaults) + _server_yaml(*base_servers)
+    )
+    for name, servers in fragments.items():
+        (tmp_path / f"{name}.yaml").write_text(_server_yaml(*servers))
+    return base
+
+
+# ============================================================================
+# Fragment Ordering Tests
+# ============================================================================
+
+
+@pytest.fixture
+def pool_sizes(monkeypatch):
+    sizes = []
+    executor = mcp_loader.ThreadPoolExecutor
+
+    class RecordingExecutor(executor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            sizes.append(self._max_workers)
+
+    monkeypatch.setattr(mcp_loader, "ThreadPoolExecutor", RecordingExecutor)
+    return sizes
+
+
+def test_pooled_fragments_merge_in_defaults_order(tmp_path, monkeypatch, pool_sizes):
+    defaults = ["_self_", "zeta", "alpha", "mid"]
+    base = _write_registry(
+        tmp_path,
+        defaults,
+        {"alpha": ["alpha-crm", "alpha-erp"], "mid": ["mid-crm"], "zeta": ["zeta-crm"]},
+    )
+    load_document = mcp_loader._load_document
+
+    def slow_first_fragment(path):
+        # Make the first fragment finish last on the pool
+        if path.stem == "zeta":
+            time.sleep(0.05)
+        return load_document(path)
+
+    monkeypatch.setattr(mcp_loader, "_load_document", slow_first_fragment)
+
+    snapshot = load_mcp_registry_snapshot(base, env={})
+
+    assert pool_sizes == [3]
+    assert [server.name for server in snapshot.servers] == ["base", "zeta-crm", "alpha-crm", "alpha-erp", "mid-crm"]
+    assert snapshot.sources == tuple((tmp_path / f"{name}.yaml").resolve() for name in ("mcp", "zeta", "alpha", "mid"))
+
+
+def test_missing_fragments_are_skipped_in_order(tmp_path, pool_sizes):
+    base = _write_registry(
+        tmp_path,
+        ["gamma", "missing", "beta", "alpha"],
+        {"alpha": ["a"], "beta": ["b"], "gamma": ["g"]},
+    )
+
+    snapshot = load_mcp_registry_snapshot(base, env={})
+
+    assert pool_sizes == [3]
+    assert [server.name for server in snapshot.servers] == ["base", "g", "b", "a"]
+    assert [path.stem for path in snapshot.sources] == ["mcp", "gamma", "beta", "alpha"]
+
+
+# ============================================================================
+# Merge Conflict Tests
+# ============================================================================
+
+
+def test_duplicate_server_across_fragments_names_both_files(tmp_path):
+    base = _write_registry(
+        tmp_path,
+        ["alpha", "beta", "gamma"],
+        {"alpha": ["crm"], "beta": ["erp"], "gamma": ["crm"]},
+    )
+
+    with pytest.raises(RegistryMergeError) as excinfo:
+        load_mcp_registry_snapshot(base, env={})
+
+    gamma, alpha = (tmp_path / "gamma.yaml").resolve(), (tmp_path / "alpha.yaml").resolve()
+    assert str(excinfo.value) == f"Duplicate server 'crm' in {gamma} conflicts with entry from {alpha}"
+
+
+def test_duplicate_of_base_server_names_fragment(tmp_path):
+    base = _write_registry(
+        tmp_path,
+        ["alpha", "beta", "gamma"],
+        {"alpha": ["a"], "beta": ["base"], "gamma": ["g"]},
+    )
+
+    with pytest.raises(RegistryMergeError, match="Duplicate server 'base' in .*beta.yaml conflicts with entry from .*mcp.yaml"):
+        load_mcp_registry_snapshot(base, env={})
+
+
+# ============================================================================
+# Snapshot Isolation Tests
+# ============================================================================
+
+
+SCHEMA_YAML = """\
+servers:
+  crm:
+    url: https://crm.example.com
+    schema:
+      type: object
+      required: [id]
+    tools:
+      - name: lookup
+        operation_id: lookupAccount
+        schema:
+          type: object
+          properties:
+            id: {type: string}
+"""
+
+
+def test_mutating_snapshot_schemas_does_not_leak_into_reload(tmp_path):
+    path = tmp_path / "mcp.yaml"
+    path.write_text(SCHEMA_YAML)
+    first = load_mcp_registry_snapshot(path, env={})
+
+    first.servers[0].schema["type"] = "HACKED"
+    first.servers[0].schema["required"].append("name")
+    first.servers[0].tools[0].schema["properties"]["id"]["type"] = "HACKED"
+
+    second = load_mcp_registry_snapshot(path, env={})
+
+    assert second.servers[0].schema == {"type": "object", "required": ["id"]}
+    assert second.servers[0].tools[0].schema == {"type": "object", "properties": {"id": {"type": "string"}}}
@@ -0,0 +1,51 @@
+"""
+tests/unit/test_observability_legacy.py
+
+Tests for the deprecated cuga.observability_legacy.InMemoryTracer:
+- Bounded span buffer evicting the oldest spans
+- Sequence operations callers use on `spans`
+"""
+
+import pytest
+
+from cuga.observability_legacy import DEFAULT_SPAN_CAPACITY, InMemoryTracer
+
+
+def _tracer(**kwargs):
+    with pytest.warns(DeprecationWarning):
+        return InMemoryTracer(**kwargs)
+
+
+# ============================================================================
+# Span Capacity Tests
+# ============================================================================
+
+
+def test_default_capacity():
+    assert _tracer().spans.maxlen == DEFAULT_SPAN_CAPACITY
+
+
+def test_oldest_spans_evicted_past_capacity():
+    tracer = _tracer(capacity=3)
+
+    for index in range(5):
+        tracer.start_span(f"span-{index}", trace_id="t-1")
+
+    assert [span.name for span in tracer.spans] == ["span-2", "span-3", "span-4"]
+
+
+def test_spans_support_len_iteration_and_indexing():
+    tracer = _tracer(capacity=2)
+    first = tracer.start_span("registry.reload", trace_id="t-1")
+    assert len(tracer.spans) == 1
+    assert tracer.spans[0] is tracer.spans[-1] is first
+
+    second = tracer.start_span("registry.reload", trace_id="t-2")
+    third = tracer.start_span("registry.reload", trace_id="t-3", token="secret")
+
+    assert len(tracer.spans) == 2
+    assert tracer.spans[0] is second
+    assert tracer.spans[-1] is third
+    assert [span.trace_id for span in tracer.spans] == ["t-2", "t-3"]
+    assert first not in tracer.spans
+    assert third.attributes["token"] == "[redacted]"
@@ -0,0 +1,128 @@
+"""
+tests/unit/test_registry_loader.py
+
+Tests for cuga.registry.loader.Registry entry validation and ordering:
+- Disallowed sandbox and budget policy rejection messages
+- Error precedence across entries
+- Entry order by (tier, id) on load and hot reload
+"""
+
+import pytest
+
+from cuga.registry.loader import Registry
+
+
+def _registry_yaml(*entries, defaults=""):
+    lines = [defaults, "entries:"] if defaults else ["entries:"]
+    for entry in entries:
+        fields = iter(entry.items())
+        key, value = next(fields)
+        lines.append(f"  - {key}: {value}")
+        lines.extend(f"    {key}: {value}" for key, value in fields)
+    return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# Validation Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        pytest.param(
+            _registry_yaml({"id": "crm", "ref": "r", "sandbox": "docker"}),
+            "Unsupported sandbox profile: docker",
+            id="entry-sandbox",
+        ),
+        pytest.param(
+            _registry_yaml({"id": "crm", "ref": "r"}, defaults="defaults:\n  sandbox: vm"),
+            "Unsupported sandbox profile: vm",
+            id="default-sandbox",
+        ),
+        pytest.param(
+            _registry_yaml({"id": "crm", "ref": "r", "budget_policy": "ignore"}),
+            "Invalid budget policy: ignore",
+            id="budget-policy",
+        ),
+        pytest.param(
+            _registry_yaml({"id": "crm", "ref": "r"}, {"id": "erp", "ref": "r", "sandbox": "docker"}),
+            "Unsupported sandbox profile: docker",
+            id="later-entry-sandbox",
+        ),
+        pytest.param(
+            _registry_yaml(
+                {"id": "crm", "ref": "r", "budget_policy": "ignore"},
+                {"id": "erp", "ref": "r", "sandbox": "docker"},
+            ),
+            "Invalid budget policy: ignore",
+            id="earlier-budget-before-sandbox",
+        ),
+        pytest.param(
+            _registry_yaml(
+                {"id": "crm", "ref": "r", "sandbox": "docker"},
+                {"id": "erp", "ref": "r", "budget_policy": "ignore"},
+            ),
+            "Unsupported sandbox profile: docker",
+            id="earlier-sandbox-before-budget",
+        ),
+        pytest.param(
+            _registry_yaml(
+                {"id": "crm", "ref": "r", "scopes": "[exec]"},
+                {"id": "erp", "ref": "r", "sandbox": "docker"},
+            ),
+            "Exec sandboxes must pin /workdir mounts",
+            id="earlier-exec-mount-before-sandbox",
+        ),
+    ],
+)
+def test_invalid_entries_rejected_with_first_error(content, message):
+    with pytest.raises(ValueError) as excinfo:
+        Registry._load(content)
+
+    assert str(excinfo.value) == message
+
+
+@pytest.mark.parametrize("sandbox", ["py-slim", "py-full", "node-slim", "node-full", "orchestrator"])
+@pytest.mark.parametrize("budget_policy", ["warn", "block"])
+def test_allowed_sandboxes_and_budget_policies_load(sandbox, budget_policy):
+    entries = Registry._load(
+        _registry_yaml({"id": "crm", "ref": "r", "sandbox": sandbox, "budget_policy": budget_policy})
+    )
+
+    assert [(e.sandbox, e.budget_policy) for e in entries] == [(sandbox, budget_policy)]
+
+
+# ============================================================================
+# Ordering Tests
+# ============================================================================
+
+
+ORDERING_YAML = _registry_yaml(
+    {"id": "zeta", "ref": "z"},
+    {"id": "alpha", "ref": "a2", "tier": 2},
+    {"id": "beta", "ref": "b"},
+    {"id": "alpha", "ref": "a1"},
+    {"id": "alpha", "ref": "a0"},
+)
+
+EXPECTED_ORDER = [("alpha", "a1", 1), ("alpha", "a0", 1), ("beta", "b", 1), ("zeta", "z", 1), ("alpha", "a2", 2)]
+
+
+def test_entries_sorted_by_tier_then_id():
+    entries = Registry._load(ORDERING_YAML)
+
+    # Duplicate (tier, id) pairs keep their file order
+    assert [(e.id, e.ref, e.tier) for e in entries] == EXPECTED_ORDER
+
+
+def test_load_and_hot_reload_share_entry_order(tmp_path):
+    path = tmp_path / "registry.yaml"
+    path.write_text(_registry_yaml({"id": "crm", "ref": "r"}))
+    registry = Registry(path)
+
+    registry.hot_reload(ORDERING_YAML)
+    reloaded = [(e.id, e.ref, e.tier) for e in registry.entries]
+    path.write_text(ORDERING_YAML)
+
+    assert reloaded == [(e.id, e.ref, e.tier) for e in Registry(path).entries] == EXPECTED_ORDER
@@ -0,0 +1,178 @@
+"""
+tests/unit/test_registry_loader_cache.py
+
+Tests for the stat-keyed parse cache shared by the registry loaders:
+- Repeat loads of an unchanged file reuse the parsed document
+- Size or mtime changes invalidate the cached parse
+- Registry.hot_reload drops the cached parse
+- Caller mutation of loaded entries leaves the cache intact
+- Tool and MCP registry loaders going through the same helper
+"""
+
+import os
+
+import pytest
+
+from cuga.mcp_v2.registry.loader import load_mcp_registry_snapshot
+from cuga.registry import loader
+from cuga.registry.loader import Registry
+from cuga.tools import registry as tools_registry
+from cuga.tools.registry import RegistryLoader
+
+REGISTRY_YAML = """\
+defaults:
+  sandbox: py-slim
+entries:
+  - id: crm
+    ref: cuga.tools.crm
+    mounts: [/workdir:ro]
+    scopes: [read]
+    env:
+      CRM_REGION: eu
+"""
+
+
+@pytest.fixture(autouse=True)
+def parse_cache(monkeypatch):
+    cache = {}
+    monkeypatch.setattr(loader, "_PARSE_CACHE", cache)
+    return cache
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    original = loader._read_registry_file
+
+    def counting_read(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(loader, "_read_registry_file", counting_read)
+    return calls
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    path = tmp_path / "registry.yaml"
+    path.write_text(REGISTRY_YAML)
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# ============================================================================
+# Registry Cache Tests
+# ============================================================================
+
+
+def test_second_load_is_a_cache_hit(registry_path, parse_calls):
+    first = Registry(registry_path).entries
+    second = Registry(registry_path).entries
+
+    assert len(parse_calls) == 1
+    assert [e.id for e in second] == [e.id for e in first] == ["crm"]
+
+
+def test_rewrite_with_new_size_invalidates(registry_path, parse_calls):
+    Registry(registry_path)
+    registry_path.write_text(REGISTRY_YAML + "  - id: erp\n    ref: cuga.tools.erp\n")
+
+    entries = Registry(registry_path).entries
+
+    assert len(parse_calls) == 2
+    assert [e.id for e in entries] == ["crm", "erp"]
+
+
+def test_same_size_new_mtime_invalidates(registry_path, parse_calls):
+    Registry(registry_path)
+    registry_path.write_text(REGISTRY_YAML.replace("crm", "cms"))
+    _bump_mtime(registry_path)
+
+    entries = Registry(registry_path).entries
+
+    assert len(parse_calls) == 2
+    assert [e.id for e in entries] == ["cms"]
+
+
+def test_hot_reload_pops_cached_parse(registry_path, parse_calls, parse_cache):
+    registry = Registry(registry_path)
+    assert parse_cache
+
+    registry.hot_reload(REGISTRY_YAML.replace("crm", "cms"))
+
+    assert parse_cache == {}
+    assert [e.id for e in registry.entries] == ["cms"]
+    Registry(registry_path)
+    assert len(parse_calls) == 2
+
+
+def test_mutating_entries_does_not_corrupt_cache(registry_path, parse_calls):
+    entry = Registry(registry_path).entries[0]
+    entry.mounts.append("/etc")
+    entry.scopes.append("exec")
+    entry.env["CRM_REGION"] = "us"
+    entry.env["INJECTED"] = "1"
+
+    fresh = Registry(registry_path).entries[0]
+
+    assert len(parse_calls) == 1
+    assert fresh.mounts == ["/workdir:ro"]
+    assert fresh.scopes == ["read"]
+    assert fresh.env["CRM_REGION"] == "eu"
+    assert "INJECTED" not in fresh.env
+
+
+# ============================================================================
+# Shared Helper Tests
+# ============================================================================
+
+
+def test_parses_are_cached_per_parser(registry_path, parse_cache):
+    loader._stat_cached_load(registry_path, loader._read_registry_file)
+    loader._stat_cached_load(registry_path, tools_registry._parse_payload)
+
+    assert len(parse_cache) == 2
+
+    loader._invalidate_parse_cache(registry_path)
+
+    assert parse_cache == {}
+
+
+def test_tool_registry_loader_reuses_and_invalidates_parse(monkeypatch, tmp_path):
+    path = tmp_path / "tools.json"
+    path.write_text('{"servers": [{"id": "crm", "url": "https://crm.example.com"}]}')
+    calls = []
+    original = tools_registry._parse_payload
+
+    def counting_parse(parse_path):
+        calls.append(parse_path)
+        return original(parse_path)
+
+    monkeypatch.setattr(tools_registry, "_parse_payload", counting_parse)
+
+    assert [s.id for s in RegistryLoader(path)._load()] == ["crm"]
+    assert [s.id for s in RegistryLoader(path)._load()] == ["crm"]
+    assert len(calls) == 1
+
+    path.write_text('{"servers": []}')
+    assert RegistryLoader(path)._load() == []
+    assert len(calls) == 2
+
+    assert RegistryLoader(tmp_path / "missing.json")._read_payload() == {}
+
+
+def test_mcp_snapshot_reuses_and_invalidates_parse(tmp_path, parse_calls):
+    path = tmp_path / "mcp.yaml"
+    path.write_text("servers:\n  crm:\n    url: https://crm.example.com\n")
+
+    assert [s.name for s in load_mcp_registry_snapshot(path, env={}).servers] == ["crm"]
+    assert [s.name for s in load_mcp_registry_snapshot(path, env={}).servers] == ["crm"]
+    assert len(parse_calls) == 1
+
+    path.write_text("servers:\n  erp:\n    url: https://erp.example.com\n")
+    assert [s.name for s in load_mcp_registry_snapshot(path, env={}).servers] == ["erp"]
+    assert len(parse_calls) == 2
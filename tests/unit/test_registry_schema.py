@@ -0,0 +1,319 @@
+"""
+tests/unit/test_registry_schema.py
+
+Tests for the tool registry schema validation in cuga.tools.schema:
+- Hand-rolled validator parity with jsonschema Draft7
+- fastjsonschema pre-gate in front of error collection
+- Audit records emitted by validate_registry_payload
+"""
+
+import logging
+
+import pytest
+
+from cuga.tools import schema
+
+
+def _server(**overrides):
+    server = {"id": "crm", "url": "https://crm.example.com"}
+    server.update(overrides)
+    return server
+
+
+# ============================================================================
+# Lightweight Validator Parity Tests
+# ============================================================================
+
+
+VALID_PAYLOADS = [
+    pytest.param({}, id="no-servers"),
+    pytest.param({"servers": []}, id="empty-servers"),
+    pytest.param({"servers": [_server()]}, id="minimal-server"),
+    pytest.param(
+        {"servers": [_server(enabled=False, rate_limit_per_minute=30, profile="p", extra=1)]},
+        id="all-fields",
+    ),
+    pytest.param({"servers": [_server(rate_limit_per_minute=2.0)]}, id="integral-float-integer"),
+    pytest.param({"servers": [_server(rate_limit_per_minute=1)]}, id="minimum-boundary"),
+]
+
+INVALID_PAYLOADS = [
+    pytest.param([], id="payload-not-object"),
+    pytest.param("registry", id="payload-string"),
+    pytest.param({"servers": None}, id="servers-null"),
+    pytest.param({"servers": {}}, id="servers-object"),
+    pytest.param({"servers": [5, None, [], "x"]}, id="items-not-object"),
+    pytest.param({"servers": [{}]}, id="missing-id-and-url"),
+    pytest.param({"servers": [{"id": "crm"}]}, id="missing-url"),
+    pytest.param({"servers": [_server(id=1)]}, id="string-wrong-type"),
+    pytest.param({"servers": [_server(url=None)]}, id="string-null"),
+    pytest.param({"servers": [_server(enabled=1)]}, id="boolean-from-int"),
+    pytest.param({"servers": [_server(enabled="yes")]}, id="boolean-from-string"),
+    pytest.param({"servers": [_server(rate_limit_per_minute=True)]}, id="integer-from-bool"),
+    pytest.param({"servers": [_server(rate_limit_per_minute=0.5)]}, id="integer-from-fraction"),
+    pytest.param({"servers": [_server(rate_limit_per_minute="3")]}, id="integer-from-string"),
+    pytest.param({"servers": [_server(rate_limit_per_minute=0)]}, id="minimum-violated"),
+    pytest.param({"servers": [_server(rate_limit_per_minute=-1.5)]}, id="type-and-minimum"),
+    pytest.param(
+        {"servers": [_server(), {"url": 3, "enabled": "no", "rate_limit_per_minute": -1.0}, _server(id=None)]},
+        id="mixed-entries",
+    ),
+]
+
+
+def _sanitized(validator, payload):
+    return [schema._sanitize_error(err) for err in validator.iter_errors(payload)]
+
+
+@pytest.fixture(scope="module")
+def draft7():
+    jsonschema = pytest.importorskip("jsonschema")
+    return jsonschema.Draft7Validator(schema._SCHEMA)
+
+
+@pytest.mark.parametrize("payload", VALID_PAYLOADS)
+def test_lightweight_accepts_what_draft7_accepts(draft7, payload):
+    assert _sanitized(draft7, payload) == []
+    assert _sanitized(schema._LightweightValidator(), payload) == []
+
+
+@pytest.mark.parametrize("payload", INVALID_PAYLOADS)
+def test_lightweight_errors_match_draft7(draft7, payload):
+    expected = _sanitized(draft7, payload)
+
+    assert expected, "case must be invalid under Draft7"
+    assert _sanitized(schema._LightweightValidator(), payload) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected", "valid"),
+    [
+        ("x", "string", True),
+        (1, "string", False),
+        (True, "boolean", True),
+        (0, "boolean", False),
+        (3, "integer", True),
+        (3.0, "integer", True),
+        (3.5, "integer", False),
+        (False, "integer", False),
+        (2.5, "number", True),
+        (True, "number", False),
+        ("1", "number", False),
+    ],
+)
+def test_is_type_matches_draft7_type_checker(draft7, value, expected, valid):
+    assert schema._is_type(value, expected) is valid
+    assert draft7.TYPE_CHECKER.is_type(value, expected) is valid
+
+
+# ============================================================================
+# fastjsonschema Pre-gate Tests
+# ============================================================================
+
+
+class _RecordingValidator:
+    """Registry-schema validator that records whether errors were collected."""
+
+    schema = schema._SCHEMA
+
+    def __init__(self):
+        self.calls = 0
+
+    def iter_errors(self, payload):
+        self.calls += 1
+        return schema._LIGHTWEIGHT_VALIDATOR.iter_errors(payload)
+
+
+@pytest.fixture
+def fast_gate():
+    if schema._FAST_VALIDATE is None:
+        pytest.skip("fastjsonschema not installed")
+
+
+def test_valid_payload_skips_error_collection(fast_gate):
+    validator = _RecordingValidator()
+
+    assert schema._collect_errors({"servers": [_server(), _server(id="erp")]}, validator) == []
+    assert validator.calls == 0
+
+
+def test_invalid_payload_still_collects_full_error_list(fast_gate):
+    payload = {"servers": [_server(), {"url": 3, "enabled": "no", "rate_limit_per_minute": 0}]}
+    validator = _RecordingValidator()
+
+    errors = schema._collect_errors(payload, validator)
+
+    assert validator.calls == 1
+    assert [schema._sanitize_error(err) for err in errors] == _sanitized(schema._LIGHTWEIGHT_VALIDATOR, payload)
+    assert [err.validator for err in errors] == ["required", "type", "type", "minimum"]
+
+
+def test_gate_is_bypassed_for_foreign_schemas(fast_gate):
+    validator = _RecordingValidator()
+    validator.schema = {"type": "object"}
+
+    assert schema._collect_errors({"servers": []}, validator) == []
+    assert validator.calls == 1
+
+
+# ============================================================================
+# Audit Record Tests
+# ============================================================================
+
+
+AUDIT_CONTEXT = {"actor": "ops", "correlation_id": "corr-1", "token": "secret"}
+
+
+def _audit_fields(record):
+    fields = ("event", "operation", "outcome", "actor", "correlation_id", "token", "reason")
+    fields += ("accepted", "rejected", "total", "validator", "path")
+    return {name: getattr(record, name) for name in fields if hasattr(record, name)}
+
+
+@pytest.fixture
+def audit_logger_name(caplog):
+    name = "cuga.tests.registry_schema"
+    caplog.set_level(logging.INFO, logger=name)
+    return name
+
+
+def test_partial_payload_emits_violation_and_summary(caplog, audit_logger_name):
+    payload = {"servers": [_server(), _server(rate_limit_per_minute=0)]}
+
+    accepted = schema.validate_registry_payload(
+        payload,
+        schema.get_fast_registry_validator(),
+        logging.getLogger(audit_logger_name),
+        audit_context=AUDIT_CONTEXT,
+    )
+
+    assert accepted == [_server()]
+    assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+        (logging.WARNING, "registry_schema_violation"),
+        (logging.INFO, "registry_schema_validation"),
+    ]
+    violation, summary = (_audit_fields(r) for r in caplog.records)
+    assert violation == {
+        "event": "registry_schema_violation",
+        "operation": "registry_schema_validation",
+        "outcome": "failure",
+        "actor": "ops",
+        "correlation_id": "corr-1",
+        "validator": "minimum",
+        "path": ["servers", 1, "rate_limit_per_minute"],
+    }
+    assert summary == {
+        "event": "registry_schema_validation",
+        "operation": "registry_schema_validation",
+        "outcome": "partial",
+        "actor": "ops",
+        "correlation_id": "corr-1",
+        "accepted": 1,
+        "rejected": 1,
+        "total": 2,
+    }
+
+
+@pytest.mark.parametrize(
+    ("servers", "outcome"),
+    [
+        ([_server()], "success"),
+        ([{"id": "crm"}], "failure"),
+    ],
+)
+def test_summary_outcome(caplog, audit_logger_name, servers, outcome):
+    schema.validate_registry_payload(
+        {"servers": servers}, schema.get_fast_registry_validator(), logging.getLogger(audit_logger_name)
+    )
+
+    summary = caplog.records[-1]
+    assert summary.event == "registry_schema_validation"
+    assert summary.outcome == outcome
+
+
+def test_non_list_servers_fast_fails_with_invalid_record(caplog, audit_logger_name):
+    logger = logging.getLogger(audit_logger_name)
+
+    assert schema.validate_registry_payload({"servers": {"id": "crm"}}, schema.get_fast_registry_validator(), logger) == []
+    assert [_audit_fields(r) for r in caplog.records] == [
+        {
+            "event": "registry_schema_invalid",
+            "operation": "registry_schema_validation",
+            "outcome": "failure",
+            "reason": "servers_not_list",
+        },
+        {
+            "event": "registry_schema_validation",
+            "operation": "registry_schema_validation",
+            "outcome": "failure",
+            "accepted": 0,
+            "rejected": 0,
+            "total": 0,
+        },
+    ]
+    assert "crm" not in caplog.text
+
+    with pytest.raises(ValueError, match="Invalid registry schema"):
+        schema.validate_registry_payload(
+            {"servers": "crm"}, schema.get_fast_registry_validator(), logger, fail_on_validation_error=True
+        )
+
+
+@pytest.fixture
+def unhandled_logger():
+    # Detached from the logging hierarchy so no root (or pytest capture)
+    # handler is reachable from it.
+    return logging.Logger("cuga.tests.registry_schema.unhandled", logging.INFO)
+
+
+@pytest.fixture
+def audit_calls(monkeypatch):
+    calls = []
+    original = schema._AuditLogger.audit
+
+    def recording_audit(self, level, event, **kwargs):
+        calls.append(event)
+        original(self, level, event, **kwargs)
+
+    monkeypatch.setattr(schema._AuditLogger, "audit", recording_audit)
+    return calls
+
+
+def test_records_skipped_without_handlers(monkeypatch, unhandled_logger, audit_calls):
+    monkeypatch.setattr(logging, "lastResort", None)
+    sanitized = []
+    monkeypatch.setattr(schema, "_sanitize_error", lambda err: sanitized.append(err) or {})
+    payload = {"servers": [_server(), _server(rate_limit_per_minute=0)]}
+
+    assert schema.validate_registry_payload(payload, schema.get_fast_registry_validator(), unhandled_logger) == [
+        _server()
+    ]
+    assert audit_calls == []
+    assert sanitized == []
+
+    with pytest.raises(ValueError, match="Invalid registry schema"):
+        schema.validate_registry_payload(
+            payload, schema.get_fast_registry_validator(), unhandled_logger, fail_on_validation_error=True
+        )
+
+
+def test_last_resort_still_receives_warnings(unhandled_logger, audit_calls):
+    assert logging.lastResort is not None
+    payload = {"servers": [_server(rate_limit_per_minute=0)]}
+
+    schema.validate_registry_payload(payload, schema.get_fast_registry_validator(), unhandled_logger)
+
+    assert audit_calls == ["registry_schema_violation"]
+
+
+def test_records_emitted_once_handler_attached(unhandled_logger, audit_calls):
+    handler = logging.NullHandler()
+    unhandled_logger.addHandler(handler)
+    try:
+        schema.validate_registry_payload(
+            {"servers": [_server(rate_limit_per_minute=0)]}, schema.get_fast_registry_validator(), unhandled_logger
+        )
+    finally:
+        unhandled_logger.removeHandler(handler)
+
+    assert audit_calls == ["registry_schema_violation", "registry_schema_validation"]
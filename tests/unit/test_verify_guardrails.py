@@ -0,0 +1,247 @@
+"""
+tests/unit/test_verify_guardrails.py
+
+Tests for scripts/verify_guardrails.py:
+- Stable GuardrailError codes for each failed check
+- GuardrailError pickling and copying
+- Allowlisted marker checks matching with and without the thread pool
+- Inherit marker detection past the prefix-read window
+"""
+
+import copy
+import dataclasses
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from scripts import verify_guardrails as vg  # noqa: E402
+
+ROOT_AGENTS_TEXT = "Allowlist, denylist, escalation, budget and redaction rules for planner, worker and coordinator.\n"
+CHANGELOG_TEXT = "# Changelog\n\n## vNext\n- Tighten guardrail checks\n\n## v1.0.0\n- Initial release\n"
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Minimal repo layout that passes every check."""
+
+    (tmp_path / "AGENTS.md").write_text(ROOT_AGENTS_TEXT, encoding="utf-8")
+    (tmp_path / "CHANGELOG.md").write_text(CHANGELOG_TEXT, encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / ".guardrails-inherit").write_text(vg.INHERIT_MARKER + "\n", encoding="utf-8")
+
+    monkeypatch.setattr(vg, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(vg, "ROOT_AGENTS", tmp_path / "AGENTS.md")
+    monkeypatch.setattr(vg, "CHANGELOG", tmp_path / "CHANGELOG.md")
+    monkeypatch.setattr(vg, "CONFIG", dataclasses.replace(vg.CONFIG, allowlisted_dirs=("src",)))
+    return tmp_path
+
+
+# ============================================================================
+# Error Code Tests
+# ============================================================================
+
+
+def _write(root, relative, text):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _break_missing_agents(root):
+    (root / "AGENTS.md").unlink()
+
+
+def _break_root_keywords(root):
+    _write(root, "AGENTS.md", ROOT_AGENTS_TEXT.replace("budget", "spend"))
+
+
+def _break_interface_contracts(root):
+    _write(root, "AGENTS.md", ROOT_AGENTS_TEXT.replace("planner", "scheduler"))
+
+
+def _break_missing_marker(root):
+    (root / "src" / ".guardrails-inherit").unlink()
+
+
+def _break_invalid_marker(root):
+    _write(root, "src/.guardrails-inherit", "Local overrides apply here.\n")
+
+
+def _break_local_canonical(root):
+    _write(root, "docs/AGENTS.md", f"Canonical rules for docs.\n{vg.INHERIT_MARKER}\n")
+
+
+def _break_local_marker(root):
+    _write(root, "docs/AGENTS.md", "Docs-specific notes.\n")
+
+
+def _break_missing_changelog(root):
+    (root / "CHANGELOG.md").unlink()
+
+
+def _break_missing_vnext(root):
+    _write(root, "CHANGELOG.md", "# Changelog\n\n## v1.0.0\n- Initial release\n")
+
+
+def _break_empty_vnext(root):
+    _write(root, "CHANGELOG.md", "# Changelog\n\n## vNext\n\n## v1.0.0\n- Initial release\n")
+
+
+def _break_vnext_guardrail(root):
+    _write(root, "CHANGELOG.md", "# Changelog\n\n## vNext\n- Refresh docs\n")
+    return ["AGENTS.md", *vg.CONFIG.required_docs]
+
+
+def _break_doc_update(root):
+    return ["registry.yaml", "README.md"]
+
+
+@pytest.mark.parametrize(
+    ("break_repo", "code"),
+    [
+        (_break_missing_agents, vg.MISSING_AGENTS),
+        (_break_root_keywords, vg.MISSING_ROOT_KEYWORDS),
+        (_break_interface_contracts, vg.MISSING_INTERFACE_CONTRACTS),
+        (_break_missing_marker, vg.MISSING_INHERIT_MARKER),
+        (_break_invalid_marker, vg.INVALID_INHERIT_MARKER),
+        (_break_local_canonical, vg.LOCAL_AGENTS_CANONICAL),
+        (_break_local_marker, vg.LOCAL_AGENTS_MISSING_MARKER),
+        (_break_missing_changelog, vg.MISSING_CHANGELOG),
+        (_break_missing_vnext, vg.MISSING_VNEXT),
+        (_break_empty_vnext, vg.EMPTY_VNEXT),
+        (_break_vnext_guardrail, vg.MISSING_VNEXT_GUARDRAIL),
+        (_break_doc_update, vg.MISSING_DOC_UPDATE),
+    ],
+    ids=lambda value: value if isinstance(value, str) else None,
+)
+def test_each_failure_reports_its_code(repo, break_repo, code):
+    changed_files = break_repo(repo) or []
+
+    errors = vg.run_checks(changed_files=changed_files)
+
+    assert [error.code for error in errors] == [code]
+    assert isinstance(errors[0], str) and errors[0]
+
+
+def test_clean_repo_passes(repo):
+    assert vg.run_checks(changed_files=["AGENTS.md", *vg.CONFIG.required_docs]) == []
+
+
+def test_errors_compare_and_print_as_messages(repo):
+    _break_missing_marker(repo)
+
+    (error,) = vg.run_checks(changed_files=[])
+
+    assert error == "Missing guardrail inheritance marker in src"
+    assert f"- {error}" == "- Missing guardrail inheritance marker in src"
+
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [
+        pytest.param(lambda error: pickle.loads(pickle.dumps(error)), id="pickle"),
+        pytest.param(copy.copy, id="copy"),
+        pytest.param(copy.deepcopy, id="deepcopy"),
+    ],
+)
+def test_errors_survive_pickle_and_copy(clone):
+    error = vg.GuardrailError(vg.MISSING_INHERIT_MARKER, "Missing guardrail inheritance marker in src")
+
+    cloned = clone(error)
+
+    assert type(cloned) is vg.GuardrailError
+    assert cloned.code == vg.MISSING_INHERIT_MARKER
+    assert cloned == "Missing guardrail inheritance marker in src"
+
+# ============================================================================
+# Parallel Marker Check Tests
+# ============================================================================
+
+
+@pytest.fixture
+def marker_dirs(repo, monkeypatch):
+    """Four allowlisted dirs (the pool threshold), one per marker outcome."""
+
+    _write(repo, "ok/.guardrails-inherit", vg.INHERIT_MARKER)
+    _write(repo, "invalid/.guardrails-inherit", "Local overrides apply here.\n")
+    (repo / "unmarked").mkdir()
+    dirs = ("ok", "invalid", "absent", "unmarked")
+    monkeypatch.setattr(vg, "CONFIG", dataclasses.replace(vg.CONFIG, allowlisted_dirs=dirs))
+    return dirs
+
+
+@pytest.fixture
+def pool_uses(monkeypatch):
+    uses = []
+    executor = vg.ThreadPoolExecutor
+
+    class RecordingExecutor(executor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            uses.append(self._max_workers)
+
+    monkeypatch.setattr(vg, "ThreadPoolExecutor", RecordingExecutor)
+    return uses
+
+
+def test_pool_results_match_sequential_at_threshold(repo, marker_dirs, pool_uses, monkeypatch):
+    assert len(marker_dirs) == vg.PARALLEL_MARKER_MIN_DIRS
+
+    pooled = vg.ensure_allowlisted_inherit_markers(repo)
+    assert pool_uses == [len(marker_dirs)]
+
+    monkeypatch.setattr(vg, "PARALLEL_MARKER_MIN_DIRS", len(marker_dirs) + 1)
+    sequential = vg.ensure_allowlisted_inherit_markers(repo)
+    assert pool_uses == [len(marker_dirs)]
+
+    assert [(e.code, str(e)) for e in pooled] == [(e.code, str(e)) for e in sequential]
+    assert [(e.code, str(e)) for e in pooled] == [
+        (vg.INVALID_INHERIT_MARKER, "Guardrail inheritance marker in invalid must state that root guardrails apply unchanged."),
+        (vg.MISSING_INHERIT_MARKER, "Missing guardrail inheritance marker in unmarked"),
+    ]
+
+
+def test_below_threshold_checks_run_inline(repo, marker_dirs, pool_uses, monkeypatch):
+    dirs = marker_dirs[: vg.PARALLEL_MARKER_MIN_DIRS - 1]
+    monkeypatch.setattr(vg, "CONFIG", dataclasses.replace(vg.CONFIG, allowlisted_dirs=dirs))
+
+    errors = vg.ensure_allowlisted_inherit_markers(repo)
+
+    assert pool_uses == []
+    assert [e.code for e in errors] == [vg.INVALID_INHERIT_MARKER]
+
+
+# ============================================================================
+# Inherit Marker Detection Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        pytest.param(vg.INHERIT_MARKER, True, id="exact"),
+        pytest.param(vg.INHERIT_MARKER + "\nExtra context.\n", True, id="leading"),
+        pytest.param("# Guardrails\n\n" + vg.INHERIT_MARKER + "\n", True, id="after-header"),
+        pytest.param("x" * 4096 + vg.INHERIT_MARKER, True, id="far-past-window"),
+        pytest.param("Überblick: " + vg.INHERIT_MARKER, True, id="non-ascii-prefix"),
+        pytest.param(vg.INHERIT_MARKER[:-1], False, id="truncated"),
+        pytest.param(vg.INHERIT_MARKER.lower(), False, id="case-differs"),
+        pytest.param("", False, id="empty"),
+    ],
+)
+def test_has_inherit_marker_falls_back_to_full_text(tmp_path, content, expected):
+    marker = tmp_path / ".guardrails-inherit"
+    marker.write_text(content, encoding="utf-8")
+
+    assert vg._has_inherit_marker(marker) is expected
+
+
+def test_marker_past_prefix_window_passes_checks(repo):
+    _write(repo, "src/.guardrails-inherit", "# Source tree\n\n" + vg.INHERIT_MARKER + "\n")
+
+    assert vg.ensure_allowlisted_inherit_markers(repo) == []
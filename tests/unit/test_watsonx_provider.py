@@ -0,0 +1,229 @@
+"""
+tests/unit/test_watsonx_provider.py
+
+Tests for cuga.providers.watsonx_provider.WatsonxProvider:
+- Persistent audit log handle (append, close, reopen)
+- Copy/serialization of providers holding runtime state
+- Seeded-response LRU cache
+- Function model schema cache
+"""
+
+import copy
+import dataclasses
+import json
+
+import pytest
+
+from cuga.providers import watsonx_provider
+from cuga.providers.watsonx_provider import BaseModel, WatsonxProvider
+
+
+class FakeClient:
+    """Stands in for the ibm-watsonx-ai model; counts generate_text calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate_text(self, prompt, seed=None):
+        self.calls.append((prompt, seed))
+        return {"output_text": f"{prompt}:{len(self.calls)}", "usage": {"input_tokens": len(prompt)}}
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def provider(tmp_path, client):
+    provider = WatsonxProvider(
+        api_key="key",
+        project_id="project",
+        audit_path=tmp_path / "audit" / "model_calls.jsonl",
+        actor_id="tester",
+        client=client,
+    )
+    yield provider
+    provider.close()
+
+
+def _audit_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+# ============================================================================
+# Audit Log Handle Tests
+# ============================================================================
+
+
+def test_each_generate_appends_one_audit_line(provider):
+    for prompt in ("a", "b", "c"):
+        provider.generate(prompt)
+
+    records = _audit_lines(provider.audit_path)
+    assert [r["request"]["prompt"] for r in records] == ["a", "b", "c"]
+    assert all(r["actor"] == "tester" and r["ts"] for r in records)
+
+
+def test_close_then_generate_reopens_and_appends(provider):
+    provider.generate("before")
+    provider.close()
+    provider.close()  # idempotent
+
+    provider.generate("after")
+
+    assert [r["request"]["prompt"] for r in _audit_lines(provider.audit_path)] == ["before", "after"]
+
+
+def test_reassigned_audit_path_opens_new_file(provider, tmp_path):
+    first_path = provider.audit_path
+    provider.generate("first")
+
+    provider.audit_path = tmp_path / "rotated" / "model_calls.jsonl"
+    provider.generate("second")
+
+    assert [r["request"]["prompt"] for r in _audit_lines(first_path)] == ["first"]
+    assert [r["request"]["prompt"] for r in _audit_lines(provider.audit_path)] == ["second"]
+
+
+def test_provider_with_open_handle_can_be_copied(provider):
+    provider.generate("open the handle")
+
+    clone = copy.deepcopy(provider)
+    clone.generate("from the clone")
+    clone.close()
+
+    assert dataclasses.asdict(provider)["audit_path"] == provider.audit_path
+    assert "_audit_handle" not in dataclasses.asdict(provider)
+    assert len(_audit_lines(provider.audit_path)) == 2
+
+
+# ============================================================================
+# Seeded Response Cache Tests
+# ============================================================================
+
+
+def test_repeated_seeded_prompt_calls_model_once(provider, client):
+    first = provider.generate("plan", seed=7)
+    second = provider.generate("plan", seed=7)
+
+    assert client.calls == [("plan", 7)]
+    assert second["output_text"] == first["output_text"]
+    # Cache hits are still audited
+    assert len(_audit_lines(provider.audit_path)) == 2
+
+
+def test_different_seed_or_parameters_miss_the_cache(provider, client):
+    provider.generate("plan", seed=7)
+    provider.generate("plan", seed=8)
+    provider.temperature = 0.5
+    provider.generate("plan", seed=7)
+
+    assert len(client.calls) == 3
+
+
+def test_unseeded_calls_are_never_cached(provider, client):
+    provider.generate("plan")
+    provider.generate("plan")
+
+    assert len(client.calls) == 2
+    assert len(provider._seeded_responses) == 0
+
+
+def test_oldest_seeded_response_evicted_past_cache_size(monkeypatch, provider, client):
+    monkeypatch.setattr(watsonx_provider, "SEEDED_CACHE_SIZE", 2)
+
+    for seed in (1, 2, 3):
+        provider.generate("plan", seed=seed)
+    assert len(provider._seeded_responses) == 2
+
+    provider.generate("plan", seed=3)
+    assert len(client.calls) == 3
+    provider.generate("plan", seed=1)
+    assert len(client.calls) == 4
+
+
+def test_mutating_returned_response_does_not_corrupt_cache(provider):
+    first = provider.generate("plan", seed=7)
+    first["output_text"] = "tampered"
+    first["usage"]["input_tokens"] = -1
+
+    second = provider.generate("plan", seed=7)
+    second["usage"]["input_tokens"] = -2
+
+    third = provider.generate("plan", seed=7)
+    assert third["output_text"] == "plan:1"
+    assert third["usage"] == {"input_tokens": 4}
+
+
+# ============================================================================
+# Function Schema Cache Tests
+# ============================================================================
+
+
+def _counting_model(name, properties, schema_calls):
+    """Function model whose schema builds are recorded in ``schema_calls``."""
+
+    def model_json_schema(cls, *args, **kwargs):
+        schema_calls.append(cls.__name__)
+        return {"properties": copy.deepcopy(properties), "required": list(properties)}
+
+    return type(name, (BaseModel,), {"model_json_schema": classmethod(model_json_schema)})
+
+
+@pytest.fixture
+def schema_calls():
+    return []
+
+
+@pytest.fixture
+def schema_cache(monkeypatch):
+    cache = {}
+    monkeypatch.setattr(watsonx_provider, "_SCHEMA_CACHE", cache)
+    return cache
+
+
+def test_repeated_schema_lookups_build_schema_once(schema_cache, schema_calls):
+    model = _counting_model("LookupAccount", {"account_id": {"type": "string"}}, schema_calls)
+
+    first = watsonx_provider._model_schema(model)
+    second = watsonx_provider._model_schema(model)
+
+    assert schema_calls == ["LookupAccount"]
+    assert first == second == {"properties": {"account_id": {"type": "string"}}, "required": ["account_id"]}
+
+
+def test_each_model_gets_its_own_schema_entry(schema_cache, schema_calls):
+    lookup = _counting_model("LookupAccount", {"account_id": {"type": "string"}}, schema_calls)
+    score = _counting_model("ScoreAccount", {"score": {"type": "number"}}, schema_calls)
+
+    assert watsonx_provider._model_schema(lookup)["required"] == ["account_id"]
+    assert watsonx_provider._model_schema(score)["required"] == ["score"]
+    watsonx_provider._model_schema(lookup)
+
+    assert set(schema_cache) == {lookup, score}
+    assert schema_calls == ["LookupAccount", "ScoreAccount"]
+
+
+def test_callers_cannot_change_cached_schema(schema_cache, schema_calls):
+    model = _counting_model("LookupAccount", {"account_id": {"type": "string"}}, schema_calls)
+    schema = watsonx_provider._model_schema(model)
+
+    schema["required"].append("injected")
+    schema["properties"]["account_id"]["type"] = "integer"
+
+    assert watsonx_provider._model_schema(model) == {
+        "properties": {"account_id": {"type": "string"}},
+        "required": ["account_id"],
+    }
+    assert schema_calls == ["LookupAccount"]
+
+
+def test_function_call_reuses_cached_schema(provider, client, schema_cache, schema_calls):
+    model = _counting_model("LookupAccount", {"account_id": {"type": "string"}}, schema_calls)
+
+    for _ in range(3):
+        assert provider.function_call([model], "lookup")["validation"] == []
+
+    assert schema_calls == ["LookupAccount"]
+    assert len(client.calls) == 3